@@ -5,7 +5,7 @@ This package provides functionality to fetch historical market data
 and interact with Bybit's V5 API.
 """
 
-from .fetch_bybit import get_ohlcv, get_available_symbols
+from .fetch_bybit import BybitAPIError, get_ohlcv, get_ohlcv_many, get_ohlcv_many_async, get_available_symbols, is_closed_range, closed_end_date
 
 __version__ = "1.0.0"
-__all__ = ["get_ohlcv", "get_available_symbols"] 
\ No newline at end of file
+__all__ = ["BybitAPIError", "get_ohlcv", "get_ohlcv_many", "get_ohlcv_many_async", "get_available_symbols", "is_closed_range", "closed_end_date"] 
\ No newline at end of file
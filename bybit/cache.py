@@ -0,0 +1,117 @@
+"""
+OHLCV Cache Module
+
+This module stores closed OHLCV candles on disk as Parquet files, one file per
+(symbol, interval, category), so historical ranges only have to be fetched
+from Bybit once. Candles are immutable once closed; the still-open candle is
+never written and is always fetched again. Each file also records how far
+back Bybit was already asked for candles, so the empty stretch before a
+symbol's listing date is not requested again.
+"""
+
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Cache location, overridable through the AITRADER_CACHE_DIR environment variable
+CACHE_DIR = Path(os.getenv('AITRADER_CACHE_DIR', Path.home() / '.aitrader_cache')) / 'bybit'
+
+# Parquet schema metadata key holding the oldest timestamp already requested from Bybit
+_PROBED_FROM_KEY = b'probed_from'
+
+
+def _cache_path(symbol: str, interval: str, category: str) -> Path:
+    """
+    Get the Parquet file path for a (symbol, interval, category) key.
+    
+    Args:
+        symbol (str): Trading pair symbol
+        interval (str): Candlestick interval
+        category (str): Product category
+    
+    Returns:
+        Path: Location of the cache file
+    """
+    key = hashlib.sha256(f"{category}:{symbol}:{interval}".encode()).hexdigest()[:32]
+    return CACHE_DIR / f"{key}.parquet"
+
+
+def load_candles(symbol: str, interval: str, category: str) -> Tuple[Optional[pa.Table], Optional[int]]:
+    """
+    Load the cached candles for a symbol.
+    
+    Args:
+        symbol (str): Trading pair symbol
+        interval (str): Candlestick interval
+        category (str): Product category
+    
+    Returns:
+        Tuple[Optional[pa.Table], Optional[int]]: Cached candles sorted by
+            timestamp (None if nothing is cached or the file cannot be read),
+            and the Unix timestamp in milliseconds from which Bybit is known to
+            have no candles older than the cached ones (None if not recorded)
+    """
+    path = _cache_path(symbol, interval, category)
+    
+    if not path.exists():
+        return None, None
+    
+    try:
+        table = pq.read_table(path)
+    except (OSError, pa.ArrowException) as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None, None
+    
+    if not table.num_rows:
+        return None, None
+    
+    metadata = table.schema.metadata or {}
+    probed_from = int(metadata[_PROBED_FROM_KEY]) if _PROBED_FROM_KEY in metadata else None
+    
+    # Drop the schema metadata (also pandas index info in older files) so the
+    # table concatenates with freshly fetched pages
+    return table.replace_schema_metadata(), probed_from
+
+
+def store_candles(
+    symbol: str,
+    interval: str,
+    category: str,
+    table: pa.Table,
+    probed_from: Optional[int] = None
+) -> None:
+    """
+    Replace the cached candles for a symbol.
+    
+    The file is written next to its final location and then renamed, so
+    concurrent readers never see a partially written file.
+    
+    Args:
+        symbol (str): Trading pair symbol
+        interval (str): Candlestick interval
+        category (str): Product category
+        table (pa.Table): Closed candles sorted by timestamp
+        probed_from (Optional[int]): Unix timestamp in milliseconds from which
+            Bybit was asked for candles and had none older than the table's first
+    """
+    path = _cache_path(symbol, interval, category)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    
+    if probed_from is not None:
+        table = table.replace_schema_metadata({_PROBED_FROM_KEY: str(probed_from)})
+    
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException) as e:
+        logger.warning("Could not write cache file %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
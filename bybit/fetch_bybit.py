@@ -5,15 +5,36 @@ This module provides functions to fetch historical OHLCV (Open, High, Low, Close
 data from Bybit V5 API with automatic pagination support.
 """
 
+import asyncio
+import aiohttp
+import importlib.util
+import ijson
+import numpy as np
+import orjson
 import requests
 import pandas as pd
-from datetime import datetime, timezone
+import pyarrow as pa
+import math
+import random
+import threading
+import os
 import time
-from typing import Optional, List, Dict, Any
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Coroutine, Tuple, Union
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .cache import load_candles, store_candles
+
+try:
+    import httpx
+except ImportError:  # Optional: only needed for backend='httpx'
+    httpx = None
+
+# Logging is configured by the application; this module only emits records
 logger = logging.getLogger(__name__)
 
 # Bybit V5 API constants
@@ -21,6 +42,159 @@ BYBIT_BASE_URL = "https://api.bybit.com"
 KLINE_ENDPOINT = "/v5/market/kline"
 MAX_LIMIT = 1000  # Maximum number of candles per request according to Bybit API
 DEFAULT_LIMIT = 200  # Default limit for single requests
+MAX_CONNECTIONS_PER_HOST = 64  # Upper bound of parallel connections to the API host
+DNS_CACHE_TTL = 300  # Seconds to cache DNS lookups of the API host
+KEEPALIVE_TIMEOUT = 60  # Seconds to keep idle connections open for reuse
+MIN_CONCURRENT_REQUESTS = 1  # Lowest concurrency the backpressure control can fall to
+MAX_CONCURRENT_REQUESTS = 10  # Requests in flight at the same time
+MAX_REQUESTS_PER_SECOND = 20  # Stay well below Bybit's per-IP limit
+# Processes sharing one IP's request budget, e.g. the uvicorn workers started by
+# start_mcp_server.py; each process gets 1/N of MAX_REQUESTS_PER_SECOND
+RATE_LIMIT_PROCESSES = max(1, int(os.getenv('BYBIT_RATE_LIMIT_PROCESSES', 1)))
+MIN_REMAINING_REQUESTS = 2  # Pause until the limit resets below this many remaining requests
+TARGET_LATENCY = 1.0  # Seconds; slower responses are treated as a sign of overload
+MAX_ATTEMPTS = 6  # Attempts per request before giving up on 429/5xx/network errors
+MAX_BACKOFF = 30.0  # Upper bound in seconds for the retry delay
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+SYMBOLS_CACHE_TTL = 3600  # Seconds to reuse an instruments list; listings change rarely
+REQUEST_TIMEOUT = 30  # Seconds allowed for a single kline request
+BACKENDS = ('aiohttp', 'httpx')  # HTTP clients available for kline requests
+
+# Client used for async kline requests: aiohttp.ClientSession, or
+# httpx.AsyncClient with backend='httpx'
+AsyncSession = Any
+
+# Errors worth retrying and errors carrying an HTTP status, for either backend
+_TRANSIENT_ERRORS: Tuple[type, ...] = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+_STATUS_ERRORS: Tuple[type, ...] = (aiohttp.ClientResponseError,)
+if httpx is not None:
+    _TRANSIENT_ERRORS += (httpx.TransportError,)
+    _STATUS_ERRORS += (httpx.HTTPStatusError,)
+
+# Kline fields as returned by Bybit (identical for spot and derivatives), and the
+# column order of the DataFrames returned by get_ohlcv
+_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover')
+_OUTPUT_ORDER = ('timestamp', 'datetime', 'open', 'high', 'low', 'close', 'volume', 'turnover')
+_SCHEMA = pa.schema(
+    [('timestamp', pa.int64()), ('datetime', pa.timestamp('ms', tz='UTC'))]
+    + [(name, pa.float64()) for name in _OUTPUT_ORDER[2:]]
+)
+OUTPUT_FORMATS = ('pandas', 'arrow')  # Return types of get_ohlcv
+
+# Candle duration in milliseconds per Bybit interval. Months use the shortest
+# month so a pagination window never holds more than MAX_LIMIT candles.
+_MINUTE_MS = 60 * 1000
+_DAY_MS = 24 * 60 * _MINUTE_MS
+_INTERVAL_MS = {
+    '1': _MINUTE_MS, '3': 3 * _MINUTE_MS, '5': 5 * _MINUTE_MS,
+    '15': 15 * _MINUTE_MS, '30': 30 * _MINUTE_MS,
+    '60': 60 * _MINUTE_MS, '120': 120 * _MINUTE_MS, '240': 240 * _MINUTE_MS,
+    '360': 360 * _MINUTE_MS, '720': 720 * _MINUTE_MS,
+    'D': _DAY_MS, 'W': 7 * _DAY_MS, 'M': 28 * _DAY_MS
+}
+
+
+class BybitAPIError(aiohttp.ClientError):
+    """
+    Bybit answered a kline request with a non-zero retCode.
+    
+    Raised with either backend, so callers can catch API errors without
+    knowing which HTTP client made the request. It derives from
+    aiohttp.ClientError, which the aiohttp backend used to raise.
+    
+    Attributes:
+        ret_code (Any): Bybit's retCode
+        ret_msg (str): Bybit's retMsg
+    """
+    
+    def __init__(self, ret_code: Any, ret_msg: str) -> None:
+        super().__init__(f"Bybit API error: {ret_msg}")
+        self.ret_code = ret_code
+        self.ret_msg = ret_msg
+
+
+class _Throttle:
+    """
+    Concurrency cap and request rate limiter shared by all Bybit calls.
+    
+    There is one instance per process, used only on the fetch loop (see
+    _fetch_loop), so concurrent sync and async calls share one budget.
+    
+    The concurrency cap follows AIMD (additive increase, multiplicative
+    decrease): it grows by one after each healthy response and is halved on
+    throttling, server errors or slow responses. Since the instance lives as
+    long as the process, a later call starts from the cap earlier calls
+    settled on instead of at full concurrency.
+    
+    Usage:
+        async with throttle, throttle.limiter:
+            ...
+    """
+    
+    def __init__(self) -> None:
+        self.concurrency = MAX_CONCURRENT_REQUESTS
+        # Stretch the period rather than shrink the rate, which AsyncLimiter
+        # would reject below one request
+        self.limiter = AsyncLimiter(max_rate=MAX_REQUESTS_PER_SECOND, time_period=RATE_LIMIT_PROCESSES)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self) -> "_Throttle":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+    
+    async def record_success(self, latency: float) -> None:
+        """Grow the concurrency cap after a fast response, shrink it after a slow one."""
+        if latency > TARGET_LATENCY:
+            await self.record_failure()
+            return
+        
+        async with self._condition:
+            if self.concurrency < MAX_CONCURRENT_REQUESTS:
+                self.concurrency += 1
+                self._condition.notify()
+    
+    async def record_failure(self) -> None:
+        """Halve the concurrency cap after throttling, a server error or a timeout."""
+        async with self._condition:
+            self.concurrency = max(MIN_CONCURRENT_REQUESTS, self.concurrency // 2)
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by synchronous Bybit calls.
+    
+    Reusing one session keeps TCP/TLS connections alive between calls
+    instead of opening a new connection for every request.
+    
+    Returns:
+        requests.Session: Session with connection pooling and retries on 429/5xx
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=list(RETRY_STATUSES))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONNECTIONS_PER_HOST, max_retries=retries)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+# Symbols per category from instruments-info; only successful responses are stored
+_SYMBOLS_CACHE: TTLCache = TTLCache(maxsize=8, ttl=SYMBOLS_CACHE_TTL)
+_SYMBOLS_CACHE_LOCK = threading.Lock()
+
+# All requests run on one background event loop, so the throttle's asyncio
+# primitives (bound to the loop they are first used on) serve every caller
+_FETCH_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_THROTTLE: Optional[_Throttle] = None
+_FETCH_LOOP_LOCK = threading.Lock()
 
 
 def get_ohlcv(
@@ -28,8 +202,11 @@ def get_ohlcv(
     interval: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    category: str = "spot"
-) -> pd.DataFrame:
+    category: str = "spot",
+    use_cache: bool = True,
+    backend: str = "aiohttp",
+    as_: str = "pandas"
+) -> Union[pd.DataFrame, pa.Table]:
     """
     Fetch historical OHLCV data from Bybit V5 API with automatic pagination.
     
@@ -49,9 +226,18 @@ def get_ohlcv(
             If None, uses current time.
         category (str): Product category. Default is 'spot'. 
             Valid values: 'spot', 'linear', 'inverse', 'option'
+        use_cache (bool): Serve closed candles from the on-disk Parquet cache and
+            only fetch the missing part of the range. Only applies when start_date
+            is given. Default is True.
+        backend (str): HTTP client for the kline requests. 'aiohttp' (default) or
+            'httpx', which multiplexes all pages over a single HTTP/2 connection
+            and requires the optional httpx[http2] package.
+        as_ (str): 'pandas' (default) for a DataFrame, or 'arrow' for a
+            pyarrow.Table with the same columns, skipping the pandas conversion
+            for callers that hand the data to PyArrow, Polars or DuckDB.
     
     Returns:
-        pd.DataFrame: DataFrame with columns:
+        Union[pd.DataFrame, pa.Table]: DataFrame (or Table) with columns:
             - timestamp: Unix timestamp in milliseconds
             - datetime: Human-readable datetime (UTC)
             - open: Opening price
@@ -62,7 +248,8 @@ def get_ohlcv(
             - turnover: Trading turnover (only for derivatives)
     
     Raises:
-        requests.RequestException: If API request fails
+        BybitAPIError: If Bybit rejects the request (with either backend)
+        aiohttp.ClientError: If the HTTP request fails (httpx.HTTPError with backend='httpx')
         ValueError: If invalid parameters are provided
         KeyError: If API response format is unexpected
     
@@ -77,6 +264,247 @@ def get_ohlcv(
         >>> df = get_ohlcv('BTCUSDT', '1', '2024-01-01', '2024-01-31')
     """
     
+    return _run_sync(_fetch_ohlcv(symbol, interval, start_date, end_date, category, use_cache, backend, as_))
+
+
+def get_ohlcv_many(
+    symbols: List[str],
+    interval: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    category: str = "spot",
+    use_cache: bool = True,
+    return_exceptions: bool = False,
+    backend: str = "aiohttp",
+    as_: str = "pandas"
+) -> Dict[str, Any]:
+    """
+    Fetch historical OHLCV data for several symbols at once.
+    
+    Synchronous wrapper around get_ohlcv_many_async; see get_ohlcv for the
+    meaning of the parameters and the shape of each DataFrame.
+    
+    Args:
+        symbols (List[str]): Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+        interval (str): Candlestick interval
+        start_date (Optional[str]): Start date in format 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'
+        end_date (Optional[str]): End date in format 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'
+        category (str): Product category. Default is 'spot'
+        use_cache (bool): Whether to use the on-disk candle cache. Default is True
+        return_exceptions (bool): If True, a failed symbol maps to its exception
+            instead of aborting the whole batch. Default is False
+        backend (str): HTTP client, 'aiohttp' or 'httpx'. Default is 'aiohttp'
+        as_ (str): 'pandas' or 'arrow' result type. Default is 'pandas'
+    
+    Returns:
+        Dict[str, Any]: DataFrame or Table (or exception) per symbol, in the order given
+    
+    Example:
+        >>> frames = get_ohlcv_many(['BTCUSDT', 'ETHUSDT'], '60', '2024-01-01', '2024-01-07')
+        >>> frames['ETHUSDT'].tail()
+    """
+    return _run_sync(_fetch_many(
+        symbols, interval, start_date, end_date, category, use_cache, return_exceptions, backend, as_
+    ))
+
+
+async def get_ohlcv_many_async(
+    symbols: List[str],
+    interval: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    category: str = "spot",
+    use_cache: bool = True,
+    return_exceptions: bool = False,
+    backend: str = "aiohttp",
+    as_: str = "pandas"
+) -> Dict[str, Any]:
+    """
+    Fetch historical OHLCV data for several symbols concurrently.
+    
+    All symbols share one client session as well as the rate limiter and
+    concurrency cap, so the batch is bounded by Bybit's rate limit rather than
+    by fetching the symbols one after another.
+    
+    Args:
+        symbols (List[str]): Trading pair symbols
+        interval (str): Candlestick interval
+        start_date (Optional[str]): Start date string or None
+        end_date (Optional[str]): End date string or None
+        category (str): Product category. Default is 'spot'
+        use_cache (bool): Whether to use the on-disk candle cache. Default is True
+        return_exceptions (bool): If True, a failed symbol maps to its exception
+            instead of aborting the whole batch. Default is False
+        backend (str): HTTP client, 'aiohttp' or 'httpx'. Default is 'aiohttp'
+        as_ (str): 'pandas' or 'arrow' result type. Default is 'pandas'
+    
+    Returns:
+        Dict[str, Any]: DataFrame or Table (or exception) per symbol, in the order given
+    """
+    return await _run_on_fetch_loop(_fetch_many(
+        symbols, interval, start_date, end_date, category, use_cache, return_exceptions, backend, as_
+    ))
+
+
+async def _fetch_many(
+    symbols: List[str],
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    category: str,
+    use_cache: bool,
+    return_exceptions: bool,
+    backend: str,
+    as_: str
+) -> Dict[str, Any]:
+    """
+    Open one client session and fetch OHLCV data for several symbols.
+    
+    Args:
+        symbols (List[str]): Trading pair symbols
+        interval (str): Candlestick interval
+        start_date (Optional[str]): Start date string or None
+        end_date (Optional[str]): End date string or None
+        category (str): Product category
+        use_cache (bool): Whether to use the on-disk candle cache
+        return_exceptions (bool): If True, a failed symbol maps to its exception
+        backend (str): HTTP client, 'aiohttp' or 'httpx'
+        as_ (str): 'pandas' or 'arrow' result type
+    
+    Returns:
+        Dict[str, Any]: DataFrame or Table (or exception) per symbol, in the order given
+    """
+    async with _new_client_session(backend) as session:
+        results = await asyncio.gather(
+            *[_get_ohlcv_async(session, symbol, interval, start_date, end_date, category, use_cache, as_)
+              for symbol in symbols],
+            return_exceptions=return_exceptions
+        )
+    
+    return dict(zip(symbols, results))
+
+
+def is_closed_range(interval: str, end_date: Optional[str]) -> bool:
+    """
+    Check whether every candle up to end_date has already closed.
+    
+    Closed candles never change, so data for such a range can be cached
+    for as long as the caller likes.
+    
+    Args:
+        interval (str): Candlestick interval
+        end_date (Optional[str]): End date in format 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS';
+            None means up to now, which always includes the open candle
+    
+    Returns:
+        bool: True if the range ends before the newest, still open candle
+    
+    Raises:
+        ValueError: If end_date has an invalid format
+    
+    Example:
+        >>> is_closed_range('D', '2024-01-31')
+        True
+    """
+    if not end_date or interval not in _INTERVAL_MS:
+        return False
+    
+    return _parse_date_to_timestamp(end_date) <= _closed_cutoff(interval)
+
+
+def closed_end_date(interval: str, granularity: int = 3600) -> str:
+    """
+    Get an end date that only covers closed candles, rounded down to granularity.
+    
+    Ranges ending there can be cached like any closed range, and every call
+    within the same granularity period returns the same date, so repeated
+    reads of "everything up to now" see one stable snapshot.
+    
+    Args:
+        interval (str): Candlestick interval
+        granularity (int): Seconds the end date is rounded down to
+    
+    Returns:
+        str: End date in format 'YYYY-MM-DD HH:MM:SS' (UTC)
+    
+    Raises:
+        ValueError: If the interval is not supported
+    
+    Example:
+        >>> closed_end_date('60')
+        '2024-01-31 11:00:00'
+    """
+    if interval not in _INTERVAL_MS:
+        raise ValueError(f"Interval must be one of {list(_INTERVAL_MS)}")
+    
+    step = granularity * 1000
+    end_timestamp = _closed_cutoff(interval) // step * step
+    return datetime.fromtimestamp(end_timestamp / 1000, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+async def _fetch_ohlcv(
+    symbol: str,
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    category: str,
+    use_cache: bool,
+    backend: str,
+    as_: str
+) -> Union[pd.DataFrame, pa.Table]:
+    """
+    Open a client session and fetch OHLCV data for a single symbol.
+    
+    Args:
+        symbol (str): Trading pair symbol
+        interval (str): Candlestick interval
+        start_date (Optional[str]): Start date string or None
+        end_date (Optional[str]): End date string or None
+        category (str): Product category
+        use_cache (bool): Whether to use the on-disk candle cache
+        backend (str): HTTP client, 'aiohttp' or 'httpx'
+        as_ (str): 'pandas' or 'arrow' result type
+    
+    Returns:
+        Union[pd.DataFrame, pa.Table]: OHLCV data sorted by timestamp (oldest first)
+    """
+    async with _new_client_session(backend) as session:
+        return await _get_ohlcv_async(session, symbol, interval, start_date, end_date, category, use_cache, as_)
+
+
+async def _get_ohlcv_async(
+    session: AsyncSession,
+    symbol: str,
+    interval: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    category: str = "spot",
+    use_cache: bool = True,
+    as_: str = "pandas"
+) -> Union[pd.DataFrame, pa.Table]:
+    """
+    Fetch historical OHLCV data using an existing client session.
+    
+    When a start date is known the requested range is split up front into
+    windows of at most MAX_LIMIT candles, and the windows are fetched
+    concurrently in batches, newest first, until Bybit runs out of older
+    candles (skipping whatever the on-disk cache already holds). Without
+    a start date the history is walked backwards page by page until Bybit
+    runs out of data.
+    
+    Args:
+        session (AsyncSession): Session used for all requests
+        symbol (str): Trading pair symbol
+        interval (str): Candlestick interval
+        start_date (Optional[str]): Start date string or None
+        end_date (Optional[str]): End date string or None
+        category (str): Product category
+        use_cache (bool): Whether to use the on-disk candle cache
+        as_ (str): 'pandas' or 'arrow' result type
+    
+    Returns:
+        Union[pd.DataFrame, pa.Table]: OHLCV data sorted by timestamp (oldest first)
+    """
     # Validate inputs
     if not symbol:
         raise ValueError("Symbol cannot be empty")
@@ -84,10 +512,16 @@ def get_ohlcv(
     if not interval:
         raise ValueError("Interval cannot be empty")
     
+    if interval not in _INTERVAL_MS:
+        raise ValueError(f"Interval must be one of {list(_INTERVAL_MS)}")
+    
     valid_categories = ['spot', 'linear', 'inverse', 'option']
     if category not in valid_categories:
         raise ValueError(f"Category must be one of {valid_categories}")
     
+    if as_ not in OUTPUT_FORMATS:
+        raise ValueError(f"as_ must be one of {list(OUTPUT_FORMATS)}")
+    
     # Convert dates to timestamps if provided
     start_timestamp = None
     end_timestamp = None
@@ -101,79 +535,507 @@ def get_ohlcv(
         # If no end_date provided, use current time
         end_timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
     
-    # Collect all data
-    all_data = []
-    current_end = end_timestamp
+    base_params = {
+        'category': category,
+        'symbol': symbol,
+        'interval': interval,
+        'limit': MAX_LIMIT
+    }
+    
+    logger.info("Fetching OHLCV data for %s with interval %s", symbol, interval)
+    
+    if start_timestamp and use_cache:
+        pages = await _fetch_with_cache(session, base_params, start_timestamp, end_timestamp)
+    elif start_timestamp:
+        pages = await _fetch_range(session, base_params, start_timestamp, end_timestamp)
+    else:
+        pages = await _fetch_pages_backwards(session, base_params, end_timestamp)
+    
+    # Pages and the rows within them are oldest first, so a single
+    # concatenation already yields candles sorted by timestamp
+    tables = [page for page in pages if page.num_rows]
+    
+    if not tables:
+        logger.warning("No data fetched")
+        return _SCHEMA.empty_table() if as_ == 'arrow' else pd.DataFrame()
+    
+    # Concatenating tables only collects their chunks, nothing is copied
+    table = pa.concat_tables(tables)
+    timestamps = table['timestamp'].to_numpy()
+    assert (np.diff(timestamps) >= 0).all(), "pages must be in ascending order"
+    
+    # Trim to the date range if start_date was provided. Fetched windows never leave the
+    # range, only cached candles can, so first check the (sorted) boundary rows.
+    overfetch = bool(start_timestamp) and (
+        timestamps[0] < start_timestamp or timestamps[-1] > end_timestamp
+    )
+    
+    if overfetch:
+        first = np.searchsorted(timestamps, start_timestamp, side='left')
+        last = np.searchsorted(timestamps, end_timestamp, side='right')
+        table = table.slice(first, last - first)
+    
+    logger.info("Successfully fetched %d candles for %s", table.num_rows, symbol)
+    
+    if as_ == 'arrow':
+        return table
+    
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+async def _fetch_range(
+    session: AsyncSession,
+    base_params: Dict[str, Any],
+    start_timestamp: int,
+    end_timestamp: int
+) -> List[pa.Table]:
+    """
+    Fetch all candles in [start_timestamp, end_timestamp] concurrently.
+    
+    The windows are computed up front from the interval, so no page has to
+    wait for the previous one to learn where it ends. They are requested
+    newest first, MAX_CONCURRENT_REQUESTS at a time; a short or empty page
+    means Bybit has no older candles (e.g. before the listing date), so the
+    older windows are skipped.
+    
+    Args:
+        session (AsyncSession): Session used for all requests
+        base_params (Dict[str, Any]): Request parameters without time bounds
+        start_timestamp (int): Unix timestamp in milliseconds of the oldest candle
+        end_timestamp (int): Unix timestamp in milliseconds of the newest candle
+    
+    Returns:
+        List[pa.Table]: Pages, oldest first
+    """
+    windows = _page_windows(start_timestamp, end_timestamp, _INTERVAL_MS[base_params['interval']])
+    
+    # An empty range (start after end) has no pages to fetch
+    if not windows:
+        return []
+    
+    # One column-major buffer for the whole range, oldest window first; every
+    # page owns the MAX_LIMIT slots of its window, so concurrent pages never
+    # overlap. Rows are right-aligned in their slots so that full pages leave
+    # no gap in the buffer.
+    count = len(windows)
+    buffer = np.empty((len(_COLUMNS), count * MAX_LIMIT), dtype=np.float64)
+    
+    async def fetch_into(index: int, window: Tuple[int, int]) -> Tuple[int, int]:
+        data = await _afetch_rows(session, {**base_params, 'start': window[0], 'end': window[1]})
+        offset = (index + 1) * MAX_LIMIT - len(data)
+        _parse_rows_into(data, buffer[:, offset:offset + len(data)])
+        return offset, offset + len(data)
+    
+    logger.info("Fetching up to %d pages, %d at a time", count, MAX_CONCURRENT_REQUESTS)
+    spans: List[Tuple[int, int]] = []
+    
+    for first in range(0, count, MAX_CONCURRENT_REQUESTS):
+        batch = windows[first:first + MAX_CONCURRENT_REQUESTS]
+        batch_spans = await asyncio.gather(*[
+            fetch_into(count - 1 - (first + k), window) for k, window in enumerate(batch)
+        ])
+        spans = batch_spans[::-1] + spans
+        
+        if any(end - start < MAX_LIMIT for start, end in batch_spans):
+            break
+    
+    # Stopped early: copy the filled part so the pages do not keep the slots
+    # of the skipped windows alive
+    if spans[0][0] >= MAX_LIMIT:
+        base = spans[0][0]
+        buffer = buffer[:, base:].copy()
+        spans = [(start - base, end - base) for start, end in spans]
+    
+    # Without gaps (short pages in the middle) the whole range is a single
+    # contiguous span of the buffer
+    if all(end == next_start for (_, end), (next_start, _) in zip(spans, spans[1:])):
+        spans = [(spans[0][0], spans[-1][1])]
+    
+    return [_table_from_columns(buffer[:, start:end]) for start, end in spans if end > start]
+
+
+async def _fetch_with_cache(
+    session: AsyncSession,
+    base_params: Dict[str, Any],
+    start_timestamp: int,
+    end_timestamp: int
+) -> List[pa.Table]:
+    """
+    Fetch [start_timestamp, end_timestamp], serving closed candles from the on-disk cache.
+    
+    Only the parts of the range before and after the cached candles are
+    requested from Bybit. The newly fetched closed candles are merged into the
+    cache as long as they extend it without leaving a gap; a range that is
+    disjoint from the cache is fetched as a whole and leaves the cache as is.
+    The cache also remembers the oldest start it has asked Bybit for, so a
+    range reaching before the listing date only requests that stretch once.
+
+    Args:
+        session (AsyncSession): Session used for all requests
+        base_params (Dict[str, Any]): Request parameters without time bounds
+        start_timestamp (int): Unix timestamp in milliseconds of the oldest candle
+        end_timestamp (int): Unix timestamp in milliseconds of the newest candle
+    
+    Returns:
+        List[pa.Table]: Cached and fetched candles, oldest first; may extend beyond the range
+    """
+    symbol = base_params['symbol']
+    interval = base_params['interval']
+    category = base_params['category']
+    interval_ms = _INTERVAL_MS[interval]
+    
+    cached, probed_from = load_candles(symbol, interval, category)
+    
+    # Ranges missing before and after the cached candles
+    missing_before = missing_after = None
+    
+    if cached is None:
+        extends_cache = True
+        missing_before = (start_timestamp, end_timestamp)
+    else:
+        first_cached = cached['timestamp'][0].as_py()
+        last_cached = cached['timestamp'][-1].as_py()
+        # Bybit has no candles between probed_from and the first cached one
+        # (e.g. before the listing date), so that stretch counts as cached
+        lower_bound = first_cached if probed_from is None else min(probed_from, first_cached)
+        extends_cache = (start_timestamp <= last_cached + interval_ms
+                         and end_timestamp >= lower_bound - interval_ms)
+        
+        if not extends_cache:
+            missing_before = (start_timestamp, end_timestamp)
+        else:
+            if start_timestamp < lower_bound:
+                missing_before = (start_timestamp, lower_bound - 1)
+            if end_timestamp > last_cached:
+                missing_after = (last_cached + 1, end_timestamp)
+    
+    async def fetch_missing(window: Optional[Tuple[int, int]]) -> List[pa.Table]:
+        if window is None:
+            return []
+        return await _fetch_range(session, base_params, *window)
     
-    logger.info(f"Fetching OHLCV data for {symbol} with interval {interval}")
+    cached_count = cached.num_rows if cached is not None else 0
+    logger.info("Cache holds %d candles, fetching missing ranges %s %s", cached_count, missing_before, missing_after)
+    before, after = await asyncio.gather(fetch_missing(missing_before), fetch_missing(missing_after))
+    
+    if not extends_cache:
+        return before
+    
+    fetched = [page for page in (*before, *after) if page.num_rows]
+    tables = [page for page in (*before, cached, *after) if page is not None and page.num_rows]
+    
+    # Everything from the start of a fetched missing_before range up to the
+    # first candle is now known to be empty on Bybit's side
+    new_probed_from = start_timestamp if missing_before else probed_from
+    
+    if tables and (fetched or new_probed_from != probed_from):
+        merged = pa.concat_tables(tables)
+        closed_count = np.searchsorted(merged['timestamp'].to_numpy(), _closed_cutoff(interval), side='right')
+        
+        if closed_count > cached_count or (closed_count and new_probed_from != probed_from):
+            store_candles(symbol, interval, category, merged.slice(0, closed_count), new_probed_from)
+    
+    return tables
+
+
+async def _fetch_pages_backwards(
+    session: AsyncSession,
+    base_params: Dict[str, Any],
+    end_timestamp: int
+) -> List[pa.Table]:
+    """
+    Walk the candle history backwards from end_timestamp, one page at a time.
+    
+    This is only used when no start date is given, since the number of pages
+    cannot be known before Bybit reports that no older data is available.
+    
+    Args:
+        session (AsyncSession): Session used for all requests
+        base_params (Dict[str, Any]): Request parameters without time bounds
+        end_timestamp (int): Unix timestamp in milliseconds of the newest candle
+    
+    Returns:
+        List[pa.Table]: Pages, oldest first
+    """
+    pages = []
+    current_end = end_timestamp
     
     while True:
-        # Prepare request parameters
-        params = {
-            'category': category,
-            'symbol': symbol,
-            'interval': interval,
-            'limit': MAX_LIMIT
-        }
+        page = await _afetch_page(session, {**base_params, 'end': current_end})
+        
+        if not page.num_rows:
+            logger.info("No more data available")
+            break
         
-        # Add end timestamp to get data before this time
-        if current_end:
-            params['end'] = current_end
+        pages.append(page)
         
-        # Add start timestamp if provided and we're in the range
-        if start_timestamp and current_end:
-            params['start'] = start_timestamp
+        if page.num_rows < MAX_LIMIT:
+            logger.info("Fetched all available data")
+            break
         
+        # Update current_end for next iteration (oldest timestamp from current batch)
+        current_end = page['timestamp'][0].as_py() - 1
+    
+    return pages[::-1]
+
+
+def _new_client_session(backend: str = "aiohttp") -> AsyncSession:
+    """
+    Create a client session whose connections are shared by all pages of a fetch.
+    
+    With backend='httpx' the client negotiates HTTP/2, so concurrent pages are
+    multiplexed as streams over one TLS connection instead of opening a
+    connection per in-flight request.
+    
+    Args:
+        backend (str): 'aiohttp' or 'httpx'
+    
+    Returns:
+        AsyncSession: aiohttp session with a pooled, keep-alive connector, or an
+            HTTP/2 httpx.AsyncClient
+    
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If backend='httpx' and httpx or its HTTP/2 support (h2) is not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid backend '{backend}'. Valid options: {list(BACKENDS)}")
+    
+    if backend == 'httpx':
+        # httpx only imports h2 once a client asks for HTTP/2
+        if httpx is None or importlib.util.find_spec('h2') is None:
+            raise ImportError("backend='httpx' requires the httpx package with HTTP/2 support: pip install 'httpx[http2]'")
+        
+        # Connections above one are only opened if the server refuses HTTP/2
+        return httpx.AsyncClient(
+            http2=True,
+            base_url=BYBIT_BASE_URL,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS_PER_HOST,
+                max_keepalive_connections=MAX_CONNECTIONS_PER_HOST,
+                keepalive_expiry=KEEPALIVE_TIMEOUT
+            )
+        )
+    
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS_PER_HOST,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def _http_get(session: AsyncSession, url: str, params: Dict[str, Any]) -> Tuple[Any, bytes]:
+    """
+    Send a GET request with either backend and read the whole body.
+    
+    Args:
+        session (AsyncSession): aiohttp or httpx session
+        url (str): Absolute request URL
+        params (Dict[str, Any]): Query parameters
+    
+    Returns:
+        Tuple[Any, bytes]: Response headers and body
+    
+    Raises:
+        aiohttp.ClientResponseError / httpx.HTTPStatusError: On a 4xx/5xx status
+    """
+    if isinstance(session, aiohttp.ClientSession):
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as response:
+            response.raise_for_status()
+            return response.headers, await response.read()
+    
+    response = await session.get(url, params=params)
+    response.raise_for_status()
+    return response.headers, response.content
+
+
+def _error_status(error: Exception) -> Tuple[Optional[int], Any]:
+    """
+    Get the HTTP status and response headers of a failed request.
+    
+    Args:
+        error (Exception): Error raised by _http_get
+    
+    Returns:
+        Tuple[Optional[int], Any]: Status and headers, or (None, None) for
+            network errors and timeouts
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status, error.headers
+    
+    if httpx is not None and isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code, error.response.headers
+    
+    return None, None
+
+
+def _fetch_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop all Bybit requests run on, starting it on first use.
+    
+    Running every fetch on one loop lets a single _Throttle enforce the rate
+    limit and keep its learned concurrency across calls, whichever thread or
+    loop they come from.
+    
+    Returns:
+        asyncio.AbstractEventLoop: Loop running forever on a daemon thread
+    """
+    global _FETCH_LOOP, _THROTTLE
+    
+    with _FETCH_LOOP_LOCK:
+        if _FETCH_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="bybit-fetch", daemon=True).start()
+            _FETCH_LOOP, _THROTTLE = loop, _Throttle()
+        return _FETCH_LOOP
+
+
+def _reset_fetch_loop() -> None:
+    """Forget the parent's fetch loop in a forked child, whose copy has no running thread."""
+    global _FETCH_LOOP, _THROTTLE, _FETCH_LOOP_LOCK
+    _FETCH_LOOP = _THROTTLE = None
+    _FETCH_LOOP_LOCK = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_fetch_loop)
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the fetch loop and wait for its result from synchronous code.
+    
+    This also works when the caller is inside another running event loop
+    (e.g. an async MCP server), which is blocked until the result arrives.
+    
+    Args:
+        coro (Coroutine): Coroutine to run
+    
+    Returns:
+        Any: The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _fetch_loop()).result()
+
+
+async def _run_on_fetch_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Await a coroutine on the fetch loop from any event loop.
+    
+    Args:
+        coro (Coroutine): Coroutine to run
+    
+    Returns:
+        Any: The coroutine's result
+    """
+    loop = _fetch_loop()
+    
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def _get_throttle() -> _Throttle:
+    """
+    Get the process-wide throttle; only call this from code running on the fetch loop.
+    
+    Returns:
+        _Throttle: Throttle shared by all requests
+    """
+    _fetch_loop()
+    return _THROTTLE
+
+
+def _rate_limit_delay(headers: Any) -> float:
+    """
+    Compute how long to pause based on Bybit's rate limit response headers.
+    
+    Args:
+        headers (Any): Response headers mapping
+    
+    Returns:
+        float: Seconds to wait before the next request (0 if no pause is needed)
+    """
+    remaining = headers.get('X-Bapi-Limit-Status')
+    reset_timestamp = headers.get('X-Bapi-Limit-Reset-Timestamp')
+    
+    if remaining is None or reset_timestamp is None:
+        return 0.0
+    
+    try:
+        if int(remaining) >= MIN_REMAINING_REQUESTS:
+            return 0.0
+        reset_ms = int(reset_timestamp) - int(time.time() * 1000)
+    except ValueError:
+        return 0.0
+    
+    return max(reset_ms, 0) / 1000
+
+
+def _retry_delay(attempt: int, headers: Any = None) -> float:
+    """
+    Compute the delay before retrying a failed request.
+    
+    Args:
+        attempt (int): Zero-based number of the attempt that failed
+        headers (Any): Response headers, if a response was received
+    
+    Returns:
+        float: Seconds to wait, honoring a numeric Retry-After header when
+            present; never more than MAX_BACKOFF
+    """
+    retry_after = headers.get('Retry-After') if headers is not None else None
+    
+    if retry_after is not None:
         try:
-            # Make API request
-            response = _make_api_request(params)
-            data = response.get('result', {}).get('list', [])
-            
-            if not data:
-                logger.info("No more data available")
-                break
-            
-            # Add data to collection
-            all_data.extend(data)
-            logger.info(f"Fetched {len(data)} candles")
-            
-            # Check if we have enough data or reached start_date
-            oldest_timestamp = int(data[-1][0])  # Last item is oldest due to Bybit's desc order
-            
-            if start_timestamp and oldest_timestamp <= start_timestamp:
-                logger.info("Reached start date")
-                break
-            
-            if len(data) < MAX_LIMIT:
-                logger.info("Fetched all available data")
-                break
-            
-            # Update current_end for next iteration (oldest timestamp from current batch)
-            current_end = oldest_timestamp - 1
-            
-            # Add small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-        except Exception as e:
-            logger.error(f"Error fetching data: {e}")
-            raise
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = math.nan
+        
+        if not math.isnan(seconds):
+            return min(max(seconds, 0.0), MAX_BACKOFF)
     
-    if not all_data:
-        logger.warning("No data fetched")
-        return pd.DataFrame()
+    # Exponential backoff with jitter so parallel pages don't retry in lockstep
+    return min(2 ** attempt + random.random(), MAX_BACKOFF)
+
+
+def _closed_cutoff(interval: str) -> int:
+    """
+    Get the latest open time of a candle that is guaranteed to be closed.
     
-    # Convert to DataFrame
-    df = _convert_to_dataframe(all_data, category)
+    Args:
+        interval (str): Candlestick interval
     
-    # Filter by date range if start_date was provided
-    if start_timestamp:
-        df = df[df['timestamp'] >= start_timestamp]
+    Returns:
+        int: Unix timestamp in milliseconds; candles opened at or before it are final
+    """
+    # Months vary in length, so use the longest one to stay on the safe side
+    duration = 31 * _DAY_MS if interval == 'M' else _INTERVAL_MS[interval]
+    return int(time.time() * 1000) - duration
+
+
+def _page_windows(start_timestamp: int, end_timestamp: int, interval_ms: int) -> List[Tuple[int, int]]:
+    """
+    Split [start_timestamp, end_timestamp] into windows of at most MAX_LIMIT candles.
+    
+    Args:
+        start_timestamp (int): Unix timestamp in milliseconds of the oldest candle
+        end_timestamp (int): Unix timestamp in milliseconds of the newest candle
+        interval_ms (int): Candle duration in milliseconds
     
-    # Sort by timestamp (oldest first)
-    df = df.sort_values('timestamp').reset_index(drop=True)
+    Returns:
+        List[Tuple[int, int]]: Inclusive (start, end) windows, newest first
+    """
+    step = MAX_LIMIT * interval_ms
+    count = max(0, math.ceil((end_timestamp - start_timestamp + 1) / step))
     
-    logger.info(f"Successfully fetched {len(df)} candles for {symbol}")
-    return df
+    return [
+        (max(start_timestamp, end_timestamp - (k + 1) * step + 1), end_timestamp - k * step)
+        for k in range(count)
+    ]
 
 
 def _parse_date_to_timestamp(date_str: str) -> int:
@@ -201,106 +1063,200 @@ def _parse_date_to_timestamp(date_str: str) -> int:
         raise ValueError(f"Invalid date format: {date_str}. Use 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'") from e
 
 
-def _make_api_request(params: Dict[str, Any]) -> Dict[str, Any]:
+async def _make_api_request(session: AsyncSession, params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Make API request to Bybit V5 kline endpoint.
     
     Args:
+        session (AsyncSession): Session used for the request
         params (Dict[str, Any]): Request parameters
     
     Returns:
         Dict[str, Any]: API response data
+    
+    Raises:
+        BybitAPIError: If the response carries a non-zero retCode
     """
     url = f"{BYBIT_BASE_URL}{KLINE_ENDPOINT}"
+    throttle = _get_throttle()
     
-    try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Check API response status
-        if data.get('retCode') != 0:
-            error_msg = data.get('retMsg', 'Unknown API error')
-            raise requests.RequestException(f"Bybit API error: {error_msg}")
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            async with throttle, throttle.limiter:
+                started = time.monotonic()
+                headers, body = await _http_get(session, url, params)
+                data = orjson.loads(body)
+                delay = _rate_limit_delay(headers)
+                
+                await throttle.record_success(time.monotonic() - started)
+                
+                # Close to the per-IP limit: hold this slot until the window resets
+                if delay:
+                    logger.warning("Rate limit almost reached, pausing for %.2fs", delay)
+                    await asyncio.sleep(delay)
+            break
         
-        return data
+        except _STATUS_ERRORS + _TRANSIENT_ERRORS as e:
+            status, headers = _error_status(e)
+            retryable = status is None or status in RETRY_STATUSES
+            
+            if not retryable or attempt == MAX_ATTEMPTS - 1:
+                logger.error("API request failed: %s", e)
+                raise
+            
+            await throttle.record_failure()
+            backoff = _retry_delay(attempt, headers)
+            logger.warning("API request failed (%r), retrying in %.2fs", e, backoff)
+            await asyncio.sleep(backoff)
+    
+    # Check API response status
+    if data.get('retCode') != 0:
+        error_msg = data.get('retMsg', 'Unknown API error')
+        logger.error("API request failed: Bybit API error: %s", error_msg)
+        raise BybitAPIError(data.get('retCode'), error_msg)
+    
+    return data
+
+
+async def _afetch_page(session: AsyncSession, params: Dict[str, Any]) -> pa.Table:
+    """
+    Fetch a single page of candles and convert it to an Arrow table.
+    
+    Args:
+        session (AsyncSession): Session used for the request
+        params (Dict[str, Any]): Request parameters including time bounds
+    
+    Returns:
+        pa.Table: Candles of this page, oldest first (empty if no data)
+    """
+    return _convert_to_table(await _afetch_rows(session, params))
+
+
+async def _afetch_rows(session: AsyncSession, params: Dict[str, Any]) -> List[List]:
+    """
+    Fetch a single page of candles as raw API rows.
     
-    except requests.RequestException as e:
-        logger.error(f"API request failed: {e}")
-        raise
+    Args:
+        session (AsyncSession): Session used for the request
+        params (Dict[str, Any]): Request parameters including time bounds
+    
+    Returns:
+        List[List]: Raw candlestick rows, oldest first
+    """
+    response = await _make_api_request(session, params)
+    data = response.get('result', {}).get('list', [])
+    logger.info("Fetched %d candles", len(data))
+    # Bybit returns candles newest first; flip the page instead of sorting later
+    return data[::-1]
 
 
-def _convert_to_dataframe(data: List[List], category: str) -> pd.DataFrame:
+def _convert_to_table(data: List[List]) -> pa.Table:
     """
-    Convert raw API data to pandas DataFrame.
+    Convert raw API data to an Arrow table.
     
     Args:
         data (List[List]): Raw candlestick data from API
-        category (str): Product category
     
     Returns:
-        pd.DataFrame: Formatted DataFrame
+        pa.Table: Candles with the columns of _OUTPUT_ORDER
     """
     if not data:
-        return pd.DataFrame()
+        return _SCHEMA.empty_table()
     
-    # Define columns based on category
-    if category == 'spot':
-        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover']
-    else:  # derivatives
-        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover']
+    values = np.empty((len(_COLUMNS), len(data)), dtype=np.float64)
+    _parse_rows_into(data, values)
+    return _table_from_columns(values)
+
+
+def _parse_rows_into(data: List[List], out: np.ndarray) -> None:
+    """
+    Parse raw API rows into a column-major float64 array.
     
-    # Create DataFrame
-    df = pd.DataFrame(data, columns=columns)
+    Every numeric string is parsed exactly once, as NumPy stores it into its
+    slot; walking the page column by column (zip(*data)) fills one contiguous
+    row of out per field. Millisecond timestamps are far below 2**53 and
+    survive float64 exactly.
     
-    # Convert data types
-    df['timestamp'] = pd.to_numeric(df['timestamp'], errors='coerce')
-    df['open'] = pd.to_numeric(df['open'], errors='coerce')
-    df['high'] = pd.to_numeric(df['high'], errors='coerce')
-    df['low'] = pd.to_numeric(df['low'], errors='coerce')
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
-    df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
-    df['turnover'] = pd.to_numeric(df['turnover'], errors='coerce')
+    Args:
+        data (List[List]): Raw candlestick rows
+        out (np.ndarray): Array of shape (len(_COLUMNS), len(data)) to fill
+    """
+    for row, column in zip(out, zip(*data)):
+        row[:] = column
+
+
+def _table_from_columns(values: np.ndarray) -> pa.Table:
+    """
+    Wrap parsed candle columns in an Arrow table.
     
-    # Add human-readable datetime column
-    df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+    Args:
+        values (np.ndarray): Array of shape (len(_COLUMNS), n) as filled by _parse_rows_into
     
-    # Reorder columns
-    column_order = ['timestamp', 'datetime', 'open', 'high', 'low', 'close', 'volume']
-    if 'turnover' in df.columns:
-        column_order.append('turnover')
+    Returns:
+        pa.Table: Candles with the columns of _OUTPUT_ORDER; the float columns
+            share memory with values
+    """
+    ts = pa.array(values[0].astype(np.int64))
     
-    return df[column_order]
+    # Build the Arrow columns in the final order; the datetime column reinterprets
+    # the int64 milliseconds as a UTC timestamp without a conversion pass
+    return pa.Table.from_arrays(
+        [ts, ts.cast(pa.timestamp('ms', tz='UTC')), *[pa.array(col) for col in values[1:]]],
+        schema=_SCHEMA
+    )
 
 
 def get_available_symbols(category: str = "spot") -> List[str]:
     """
     Get list of available trading symbols for a given category.
     
+    Results are cached per category for SYMBOLS_CACHE_TTL seconds, so repeated
+    calls (e.g. symbol validation) share a single API response.
+    
     Args:
         category (str): Product category ('spot', 'linear', 'inverse', 'option')
     
     Returns:
         List[str]: List of available symbols
     """
+    with _SYMBOLS_CACHE_LOCK:
+        cached = _SYMBOLS_CACHE.get(category)
+    
+    if cached is not None:
+        return list(cached)
+    
     url = f"{BYBIT_BASE_URL}/v5/market/instruments-info"
     params = {'category': category}
     
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        with _SESSION.get(url, params=params, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # Let urllib3 undo gzip/deflate while streaming
+            
+            ret_code = None
+            error_msg = 'Unknown API error'
+            symbols = []
+            
+            # Pick the needed fields out of the parser's event stream instead of
+            # materializing a dict for every instrument
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == 'result.list.item.symbol':
+                    symbols.append(value)
+                elif prefix == 'retCode':
+                    ret_code = value
+                elif prefix == 'retMsg':
+                    error_msg = value
         
-        if data.get('retCode') != 0:
-            error_msg = data.get('retMsg', 'Unknown API error')
+        if ret_code != 0:
             raise requests.RequestException(f"Bybit API error: {error_msg}")
         
-        instruments = data.get('result', {}).get('list', [])
-        symbols = [instrument['symbol'] for instrument in instruments]
+        symbols.sort()
+        
+        with _SYMBOLS_CACHE_LOCK:
+            _SYMBOLS_CACHE[category] = tuple(symbols)
         
-        return sorted(symbols)
+        return symbols
     
     except Exception as e:
-        logger.error(f"Error fetching available symbols: {e}")
+        logger.error("Error fetching available symbols: %s", e)
         return []
@@ -1,34 +1,61 @@
 """
-Bybit AI Trading Agent MCP Server (SSE Transport)
+Bybit AI Trading Agent MCP Server
 
 This MCP (Model Context Protocol) server exposes Bybit market data fetching tools
-to AI agents via SSE (Server-Sent Events) transport, enabling them to retrieve 
-cryptocurrency market information including historical OHLCV data and available 
-trading symbols.
+to AI agents, enabling them to retrieve cryptocurrency market information
+including historical OHLCV data and available trading symbols.
 
 The server provides tools for:
 - Fetching historical candlestick (OHLCV) data with automatic pagination
 - Getting available trading symbols for different product categories
 - Supporting multiple timeframes and market categories (spot, derivatives, options)
 
-Transport: SSE (Server-Sent Events)
+Transport: Streamable HTTP when started with start_mcp_server.py
 Port: Configurable via PORT environment variable (default: 3001)
-SSE Endpoint: http://host:port/sse
+Endpoint: http://host:port/mcp
 
-Compatible with n8n MCP Client Tool nodes and other SSE-based MCP clients.
+Running this module directly (python mcp_server.py) is the legacy entry point:
+it serves SSE (Server-Sent Events) on http://host:port/sse for older n8n MCP
+Client Tool nodes and other SSE-only clients. start_mcp_server.py --transport sse
+serves the same endpoint.
 
-Tags: #cryptocurrency #trading #market-data #bybit #ohlcv #technical-analysis #ai-trading #sse #n8n
+Tags: #cryptocurrency #trading #market-data #bybit #ohlcv #technical-analysis #ai-trading #mcp #n8n
 """
 
 from fastmcp import FastMCP
-from typing import Optional, List, Dict, Any
+from mcp.types import TextContent
+from typing import Optional, List, Dict, Any, Literal, Callable, Tuple, TYPE_CHECKING
+import asyncio
+import base64
+import functools
+import heapq
+import inspect
 import json
+import re
+import threading
+from cachetools import TTLCache
 from datetime import datetime
+from itertools import islice
 import logging
 import os
+import orjson
 
-# Import our Bybit functions
-from bybit.fetch_bybit import get_ohlcv, get_available_symbols
+try:
+    from fastmcp.tools import ToolResult
+except ImportError:  # fastmcp 2.x
+    from fastmcp.tools.tool import ToolResult
+
+try:
+    import uvloop
+except ImportError:  # optional, the server falls back to the default asyncio loop
+    uvloop = None
+
+# The Bybit functions and numpy/pandas/pyarrow are imported by the code that
+# uses them, so the server starts without loading them; the first tool call
+# that fetches market data pays for the import once
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,14 +64,337 @@ logger = logging.getLogger(__name__)
 # Initialize the MCP server (FastMCP 2.0 style)
 mcp = FastMCP("Bybit Trading Agent 🚀")
 
+# How long tool calls reuse fetched candles. Ranges reaching the open candle
+# change every few seconds; fully closed ranges never change.
+RECENT_OHLCV_TTL = 5
+HISTORICAL_OHLCV_TTL = 24 * 3600
+
+# Memory each OHLCV cache may hold; least recently used results are dropped first
+OHLCV_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Quote/base assets that mark a symbol as a popular pair, matched in one scan
+_POPULAR_RE = re.compile(r'USDT|USD|BTC|ETH')
+
+# Seconds uvicorn keeps idle client connections open, so clients that call
+# tools every few seconds reuse their connection instead of reconnecting
+HTTP_KEEPALIVE_TIMEOUT = 75
+
+# Seconds a category's symbol lists are reused, as in bybit.fetch_bybit.SYMBOLS_CACHE_TTL
+SYMBOL_CATALOG_TTL = 3600
+
+# Per-symbol status markers in get_market_overview; clients match on these values
+_STATUS_OK = "✅"
+_STATUS_FAILED = "❌"
+
+
+def ttl_cache(
+    ttl_seconds: float,
+    maxsize: int = 256,
+    getsizeof: Optional[Callable[[Any], int]] = None,
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Callable[[Callable], Callable]:
+    """
+    Cache a function's results in memory for ttl_seconds.
+    
+    Works for both plain and async functions. Results are keyed by the call
+    arguments, with lists turned into tuples so they can be hashed; raised
+    exceptions are not cached. Concurrent async calls with the same arguments
+    on one event loop share a single call of fn.
+    
+    Args:
+        ttl_seconds (float): Seconds a result stays valid
+        maxsize (int): Maximum number of cached results, or their total size
+            when getsizeof is given
+        getsizeof (Optional[Callable[[Any], int]]): Size of a result; results
+            larger than maxsize are returned but not cached
+        cache_if (Optional[Callable[[Any], bool]]): Only results for which it
+            returns True are cached
+    
+    Returns:
+        Callable[[Callable], Callable]: Decorator
+    
+    Example:
+        >>> cached_get_ohlcv = ttl_cache(5)(_fetch_ohlcv)
+    """
+    def decorator(fn: Callable) -> Callable:
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds, getsizeof=getsizeof)
+        lock = threading.Lock()
+        
+        def make_key(args: tuple, kwargs: Dict[str, Any]) -> tuple:
+            def freeze(value: Any) -> Any:
+                return tuple(value) if isinstance(value, list) else value
+            return tuple(map(freeze, args)), tuple(sorted((k, freeze(v)) for k, v in kwargs.items()))
+        
+        def store(key: tuple, value: Any) -> None:
+            if cache_if is not None and not cache_if(value):
+                return
+            with lock:
+                try:
+                    cache[key] = value
+                except ValueError:  # larger than the whole cache
+                    pass
+        
+        if inspect.iscoroutinefunction(fn):
+            pending: Dict[tuple, "asyncio.Task"] = {}
+            
+            def finish(key: tuple, task: "asyncio.Task") -> None:
+                with lock:
+                    if pending.get(key) is task:
+                        del pending[key]
+                if not task.cancelled() and task.exception() is None:
+                    store(key, task.result())
+            
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = make_key(args, kwargs)
+                loop = asyncio.get_running_loop()
+                with lock:
+                    if key in cache:
+                        return cache[key]
+                    task = pending.get(key)
+                    # A call running on another thread's loop cannot be awaited here
+                    if task is None or task.get_loop() is not loop:
+                        task = loop.create_task(fn(*args, **kwargs))
+                        pending[key] = task
+                        task.add_done_callback(functools.partial(finish, key))
+                # Shielded so one caller giving up does not cancel the others
+                return await asyncio.shield(task)
+            return async_wrapper
+        
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs)
+            with lock:
+                if key in cache:
+                    return cache[key]
+            value = fn(*args, **kwargs)
+            store(key, value)
+            return value
+        return wrapper
+    
+    return decorator
+
+
+def _nbytes(data: Any) -> int:
+    """
+    Approximate memory held by a fetch result, for sizing the OHLCV caches.
+    
+    Args:
+        data (Any): DataFrame, Arrow table, or a dict of them by symbol
+    
+    Returns:
+        int: Size in bytes
+    """
+    if isinstance(data, dict):
+        return sum(_nbytes(value) for value in data.values())
+    if hasattr(data, "memory_usage"):
+        return int(data.memory_usage(index=True).sum())
+    return getattr(data, "nbytes", 0)
+
+
+def _no_failures(frames: Dict[str, Any]) -> bool:
+    """Whether a get_ohlcv_many result holds data for every symbol."""
+    return not any(isinstance(value, Exception) for value in frames.values())
+
+
+def _fetch_ohlcv(*args: Any, **kwargs: Any) -> Any:
+    """Call bybit.fetch_bybit.get_ohlcv, importing it on first use."""
+    from bybit.fetch_bybit import get_ohlcv
+    return get_ohlcv(*args, **kwargs)
+
+
+async def _fetch_ohlcv_many_async(*args: Any, **kwargs: Any) -> Any:
+    """Call bybit.fetch_bybit.get_ohlcv_many_async, importing it on first use."""
+    from bybit.fetch_bybit import get_ohlcv_many_async
+    return await get_ohlcv_many_async(*args, **kwargs)
+
+
+_get_recent_ohlcv = ttl_cache(RECENT_OHLCV_TTL, OHLCV_CACHE_MAX_BYTES, getsizeof=_nbytes)(_fetch_ohlcv)
+_get_historical_ohlcv = ttl_cache(HISTORICAL_OHLCV_TTL, OHLCV_CACHE_MAX_BYTES, getsizeof=_nbytes)(_fetch_ohlcv)
+# Results where some symbols failed are not cached, so the next call retries them
+_get_ohlcv_many_async = ttl_cache(
+    RECENT_OHLCV_TTL, OHLCV_CACHE_MAX_BYTES, getsizeof=_nbytes, cache_if=_no_failures
+)(_fetch_ohlcv_many_async)
+
+
+def _get_ohlcv(
+    symbol: str,
+    interval: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    category: str = "spot",
+    as_: str = "pandas"
+) -> Any:
+    """
+    get_ohlcv with an in-memory TTL cache in front of it.
+    
+    Closed ranges are kept for a day, anything reaching the open candle for a
+    few seconds. DataFrames are returned as shallow copies so callers cannot
+    alter the cached frame's columns.
+    
+    Args:
+        symbol (str): Trading pair symbol
+        interval (str): Candlestick interval
+        start_date (Optional[str]): Start date string or None
+        end_date (Optional[str]): End date string or None
+        category (str): Product category
+        as_ (str): 'pandas' or 'arrow' result type
+    
+    Returns:
+        Any: DataFrame or Arrow table as returned by get_ohlcv
+    """
+    from bybit.fetch_bybit import is_closed_range
+    
+    fetch = _get_historical_ohlcv if is_closed_range(interval, end_date) else _get_recent_ohlcv
+    data = fetch(symbol, interval, start_date, end_date, category, as_=as_)
+    return data.copy(deep=False) if as_ == "pandas" else data
+
+
+def _to_tool_result(result: Dict[str, Any]) -> ToolResult:
+    """
+    Wrap a tool's dict in a ToolResult whose text content is encoded with orjson.
+    
+    Args:
+        result (Dict[str, Any]): JSON-compatible tool result
+    
+    Returns:
+        ToolResult: Text and structured content for the result
+    """
+    text = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return ToolResult(content=[TextContent(type="text", text=text)], structured_content=result)
+
+
+def orjson_result(fn: Callable) -> Callable:
+    """
+    Make a tool return its dict as a ToolResult encoded with orjson.
+    
+    Without this FastMCP serializes a returned dict to JSON text twice and
+    to JSON-compatible Python objects twice. Handing it a finished ToolResult
+    leaves a single orjson dump for the text content plus the one pass
+    FastMCP needs for the structured content.
+    
+    Args:
+        fn (Callable): Tool function returning a JSON-compatible dict (sync or async)
+    
+    Returns:
+        Callable: Function with the same signature returning a ToolResult
+    """
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> ToolResult:
+            return _to_tool_result(await fn(*args, **kwargs))
+        return async_wrapper
+    
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> ToolResult:
+        return _to_tool_result(fn(*args, **kwargs))
+    return wrapper
+
+
+@ttl_cache(SYMBOL_CATALOG_TTL)
+def _symbol_catalog(category: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Get the symbols of a category together with the lists derived from them.
+    
+    The sample and popular pairs are computed once per symbol list instead of
+    on every get_trading_symbols call.
+    
+    Args:
+        category (str): Product category
+    
+    Returns:
+        Tuple[List[str], List[str], List[str]]: All symbols, the first 10 as
+            samples, and up to 10 popular pairs
+    
+    Raises:
+        LookupError: If no symbols were found; such failures are not cached
+    """
+    from bybit.fetch_bybit import get_available_symbols
+    
+    symbols = get_available_symbols(category=category)
+    
+    if not symbols:
+        raise LookupError(f"No symbols found for category '{category}' or invalid category")
+    
+    # Popular/common pairs for easier discovery; stops after the tenth match
+    popular = list(islice(filter(_POPULAR_RE.search, symbols), 10))
+    return symbols, symbols[:10], popular
+
+
+def _columnar_payload(df: "pd.DataFrame") -> Dict[str, List[Any]]:
+    """
+    Convert an OHLCV DataFrame into one JSON-ready list per column.
+    
+    Each column is converted in a single vectorized pass instead of building
+    a dict per row; datetimes become ISO-8601 UTC strings.
+    
+    Args:
+        df (pd.DataFrame): OHLCV data as returned by get_ohlcv
+    
+    Returns:
+        Dict[str, List[Any]]: Column name -> list of values
+    """
+    import pandas as pd
+    import pyarrow as pa
+    
+    # Candle open times are whole seconds; Arrow's %S would print milliseconds
+    utc_seconds = pd.ArrowDtype(pa.timestamp('s', tz='UTC'))
+    return {
+        column: (df[column].astype(utc_seconds).dt.strftime('%Y-%m-%dT%H:%M:%S+00:00').tolist()
+                 if column == 'datetime' else df[column].to_numpy().tolist())
+        for column in df.columns
+    }
+
+
+def _records_payload(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Turn a columnar payload into one dict per candle.
+    
+    The rows are zipped from the already converted column lists, so no pandas
+    row access or per-cell conversion is involved.
+    
+    Args:
+        columns (Dict[str, List[Any]]): Payload as built by _columnar_payload
+    
+    Returns:
+        List[Dict[str, Any]]: Candles in order, keyed by column name
+    """
+    names = tuple(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def _arrow_ipc_b64(table: "pa.Table") -> str:
+    """
+    Serialize an Arrow table as a base64-encoded Arrow IPC stream.
+    
+    Base64 keeps the binary stream safe to embed in the JSON tool response;
+    clients decode it with pyarrow.ipc.open_stream without parsing any JSON.
+    
+    Args:
+        table (pa.Table): Table to serialize
+    
+    Returns:
+        str: Base64 text of the IPC stream
+    """
+    import pyarrow as pa
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode('ascii')
+
 
 @mcp.tool
+@orjson_result
 def fetch_historical_ohlcv(
     symbol: str,
     interval: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    category: str = "spot"
+    category: str = "spot",
+    format: Literal["json", "records", "arrow"] = "json",
+    offset: int = 0,
+    limit: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Fetch historical OHLCV (Open, High, Low, Close, Volume) candlestick data from Bybit.
@@ -67,20 +417,43 @@ def fetch_historical_ohlcv(
             • 'linear': Linear derivatives (USDT perpetuals)
             • 'inverse': Inverse derivatives  
             • 'option': Options contracts
+        format (str): Payload format - Options:
+            • 'json': Columnar JSON lists under 'data' (default)
+            • 'records': One JSON object per candle under 'data'
+            • 'arrow': Base64 Arrow IPC stream under 'arrow_ipc_b64' plus its
+              'schema', for clients that load the data with PyArrow, Polars or DuckDB
+        offset (int): Index of the first candle to return (default 0)
+        limit (Optional[int]): Maximum number of candles to return. Large ranges
+            can be read in chunks by passing 'next_offset' back as 'offset'
+            together with the returned 'end_date'; every chunk after the first
+            is then served from the server-side cache. A chunked read of a
+            range reaching the still-open candle ends at the last closed
+            candles instead, on an end date that changes only once an hour,
+            so its offsets stay stable.
+            If not provided, all candles from 'offset' on are returned
     
     Returns:
         Dict containing:
         - success (bool): Whether the operation succeeded
-        - data (List[Dict]): List of candlestick data with fields:
+        - columns (List[str]): Column names, in order
+        - data (Dict[str, List]): Columnar candlestick data, one list per column:
             • timestamp: Unix timestamp (milliseconds)
             • datetime: Human-readable UTC datetime
             • open, high, low, close: Price levels
             • volume: Trading volume
             • turnover: Trading turnover (derivatives only)
-        - count (int): Number of candles fetched
+          The i-th candle is made of the i-th entry of every list. With
+          format='records', data is a list of per-candle dicts instead.
+        - count (int): Number of candles in this chunk
+        - total_count (int): Number of candles in the whole range
+        - offset (int): Index of the first candle in this chunk
+        - next_offset (Optional[int]): Offset of the next chunk, or None if this
+          is the last one
+        - end_date (Optional[str]): End date the range was read up to; pass it
+          back with 'next_offset' to read the next chunk of the same snapshot
         - symbol (str): The requested symbol
         - interval (str): The requested interval
-        - date_range (Dict): Start and end dates of the data
+        - date_range (Dict): Start and end dates of this chunk
     
     Tags: #ohlcv #candlestick #historical-data #price-data #volume #technical-analysis
           #cryptocurrency #trading #market-data #time-series #bybit #pagination
@@ -91,20 +464,35 @@ def fetch_historical_ohlcv(
           fetch_historical_ohlcv('ETHUSDT', '60', '2024-01-01', '2024-01-07')
         • Get Solana 5-minute data with auto-pagination:
           fetch_historical_ohlcv('SOLUSDT', '5', '2024-01-01', '2024-01-31')
+        • Read the same range 1000 candles at a time:
+          fetch_historical_ohlcv('SOLUSDT', '5', '2024-01-01', '2024-01-31', limit=1000)
     """
     try:
-        logger.info(f"Fetching OHLCV data for {symbol} ({interval}) from {start_date} to {end_date}")
+        # Reject bad paging arguments before spending a fetch on them
+        if offset < 0 or (limit is not None and limit < 1):
+            raise ValueError("offset must be >= 0 and limit must be >= 1")
+        
+        # Chunks of an open range would each refetch it (the recent cache lasts
+        # seconds) and shift as candles arrive, so read a closed snapshot instead
+        if offset or limit is not None:
+            from bybit.fetch_bybit import closed_end_date, is_closed_range
+            
+            if not is_closed_range(interval, end_date):
+                end_date = closed_end_date(interval)
         
-        # Fetch data using our Bybit function
-        df = get_ohlcv(
+        logger.info("Fetching OHLCV data for %s (%s) from %s to %s", symbol, interval, start_date, end_date)
+        
+        # Fetch data using our Bybit function; the Arrow payload skips pandas entirely
+        df = _get_ohlcv(
             symbol=symbol,
             interval=interval,
             start_date=start_date,
             end_date=end_date,
-            category=category
+            category=category,
+            as_="arrow" if format == "arrow" else "pandas"
         )
         
-        if df.empty:
+        if len(df) == 0:
             return {
                 "success": False,
                 "error": "No data available for the specified parameters",
@@ -113,34 +501,74 @@ def fetch_historical_ohlcv(
                 "count": 0
             }
         
-        # Convert DataFrame to list of dictionaries for JSON serialization
-        data_records = df.to_dict('records')
+        total_count = len(df)
+        if offset >= total_count:
+            return {
+                "success": False,
+                "error": f"Offset {offset} is past the end of the {total_count} available candles",
+                "symbol": symbol,
+                "interval": interval,
+                "count": 0,
+                "total_count": total_count
+            }
         
-        # Convert datetime objects to strings for JSON serialization
-        for record in data_records:
-            if 'datetime' in record and hasattr(record['datetime'], 'isoformat'):
-                record['datetime'] = record['datetime'].isoformat()
+        # Only the requested chunk is serialized; both slices are zero-copy views
+        stop = total_count if limit is None else min(offset + limit, total_count)
+        if offset or stop < total_count:
+            df = df.slice(offset, stop - offset) if format == "arrow" else df.iloc[offset:stop]
+        next_offset = stop if stop < total_count else None
+        
+        if format == "arrow":
+            logger.info("Successfully fetched %d candles for %s", df.num_rows, symbol)
+            return {
+                "success": True,
+                "format": "arrow",
+                "arrow_ipc_b64": _arrow_ipc_b64(df),
+                "schema": [{"name": field.name, "type": str(field.type)} for field in df.schema],
+                "count": df.num_rows,
+                "total_count": total_count,
+                "offset": offset,
+                "next_offset": next_offset,
+                "end_date": end_date,
+                "symbol": symbol,
+                "interval": interval,
+                "category": category,
+                "date_range": {
+                    "start": df['datetime'][0].as_py().isoformat(),
+                    "end": df['datetime'][-1].as_py().isoformat()
+                }
+            }
+        
+        # Serialize column by column rather than as one dict per candle
+        columns = list(df.columns)
+        data = _columnar_payload(df)
+        count = len(df)
         
         result = {
             "success": True,
-            "data": data_records,
-            "count": len(data_records),
+            "columns": columns,
+            "data": _records_payload(data) if format == "records" else data,
+            "count": count,
+            "total_count": total_count,
+            "offset": offset,
+            "next_offset": next_offset,
+            "end_date": end_date,
             "symbol": symbol,
             "interval": interval,
             "category": category,
             "date_range": {
-                "start": data_records[0]['datetime'] if data_records else None,
-                "end": data_records[-1]['datetime'] if data_records else None
+                "start": data['datetime'][0],
+                "end": data['datetime'][-1]
             },
             "data_info": {
-                "columns": list(df.columns),
-                "first_timestamp": int(data_records[0]['timestamp']) if data_records else None,
-                "last_timestamp": int(data_records[-1]['timestamp']) if data_records else None,
-                "timeframe_coverage": f"{len(data_records)} candles"
+                "columns": columns,
+                "first_timestamp": data['timestamp'][0],
+                "last_timestamp": data['timestamp'][-1],
+                "timeframe_coverage": f"{count} candles"
             }
         }
         
-        logger.info(f"Successfully fetched {len(data_records)} candles for {symbol}")
+        logger.info("Successfully fetched %d candles for %s", count, symbol)
         return result
         
     except Exception as e:
@@ -155,7 +583,9 @@ def fetch_historical_ohlcv(
         }
 
 
-@mcp.tool  
+
+@mcp.tool
+@orjson_result
 def get_trading_symbols(category: str = "spot") -> Dict[str, Any]:
     """
     Retrieve all available trading symbols for a specific market category from Bybit.
@@ -188,35 +618,25 @@ def get_trading_symbols(category: str = "spot") -> Dict[str, Any]:
         • Discover available options: get_trading_symbols('option')
     """
     try:
-        logger.info(f"Fetching available symbols for category: {category}")
-        
-        # Fetch symbols using our Bybit function
-        symbols = get_available_symbols(category=category)
+        logger.info("Fetching available symbols for category: %s", category)
         
-        if not symbols:
+        # Fetch symbols using our Bybit function, along with the derived lists
+        try:
+            symbols, sample_symbols, popular_symbols = _symbol_catalog(category)
+        except LookupError as e:
             return {
                 "success": False,
-                "error": f"No symbols found for category '{category}' or invalid category",
+                "error": str(e),
                 "category": category,
                 "count": 0
             }
         
-        # Extract popular/common pairs for easier discovery
-        popular_patterns = ['USDT', 'USD', 'BTC', 'ETH']
-        popular_symbols = []
-        
-        for symbol in symbols[:50]:  # Check first 50 symbols
-            if any(pattern in symbol for pattern in popular_patterns):
-                popular_symbols.append(symbol)
-                if len(popular_symbols) >= 10:
-                    break
-        
         result = {
             "success": True,
             "symbols": symbols,
             "count": len(symbols),
             "category": category,
-            "sample_symbols": symbols[:10],
+            "sample_symbols": sample_symbols,
             "popular_pairs": popular_symbols,
             "categories_info": {
                 "spot": "Spot trading pairs (immediate settlement)",
@@ -226,7 +646,7 @@ def get_trading_symbols(category: str = "spot") -> Dict[str, Any]:
             }
         }
         
-        logger.info(f"Successfully fetched {len(symbols)} symbols for {category}")
+        logger.info("Successfully fetched %d symbols for %s", len(symbols), category)
         return result
         
     except Exception as e:
@@ -241,6 +661,7 @@ def get_trading_symbols(category: str = "spot") -> Dict[str, Any]:
 
 
 @mcp.tool
+@orjson_result
 def analyze_price_movement(
     symbol: str,
     interval: str = "D",
@@ -280,54 +701,65 @@ def analyze_price_movement(
     """
     try:
         from datetime import timedelta
+        import numpy as np
         
         # Calculate date range
         end_date = datetime.now().strftime('%Y-%m-%d')
         start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
         
-        logger.info(f"Analyzing price movement for {symbol} over {days_back} days")
+        logger.info("Analyzing price movement for %s over %d days", symbol, days_back)
         
-        # Fetch historical data
-        df = get_ohlcv(
+        # Fetch historical data as Arrow and keep only the four columns analyzed,
+        # so the rest of the range is never converted
+        table = _get_ohlcv(
             symbol=symbol,
             interval=interval,
             start_date=start_date,
             end_date=end_date,
-            category=category
-        )
+            category=category,
+            as_="arrow"
+        ).select(['close', 'high', 'low', 'volume'])
         
-        if df.empty:
+        if table.num_rows == 0:
             return {
                 "success": False,
                 "error": "No data available for analysis",
                 "symbol": symbol
             }
         
+        # Work on plain float64 arrays. A single-chunk column without nulls is viewed
+        # in place; a table merged from cached and fetched parts has several chunks,
+        # and each of its columns is copied once into one contiguous array.
+        # Their scalars are np.float64, a float subclass, so they serialize as-is.
+        close, high, low, volume = (column.to_numpy() for column in table.columns)
+        
         # Basic analysis calculations
-        current_price = float(df['close'].iloc[-1])
-        previous_price = float(df['close'].iloc[-2]) if len(df) > 1 else current_price
+        current_price = close[-1]
+        previous_price = close[-2] if len(close) > 1 else current_price
         
         # Price change analysis
         price_change_abs = current_price - previous_price
         price_change_pct = (price_change_abs / previous_price * 100) if previous_price > 0 else 0
         
-        # Volatility analysis
-        df['returns'] = df['close'].pct_change()
-        volatility = float(df['returns'].std() * 100) if len(df) > 1 else 0
+        # Volatility analysis (sample standard deviation, as pandas computes it).
+        # The division writes into the diff buffer instead of allocating another array.
+        returns = np.diff(close)
+        np.divide(returns, close[:-1], out=returns)
+        volatility = returns.std(ddof=1) * 100 if returns.size > 1 else 0
         
         # High/Low analysis
-        period_high = float(df['high'].max())
-        period_low = float(df['low'].min())
+        period_high = high.max()
+        period_low = low.min()
         
         # Volume analysis
-        avg_volume = float(df['volume'].mean())
-        current_volume = float(df['volume'].iloc[-1])
+        avg_volume = volume.mean()
+        current_volume = volume[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
         
         # Trend analysis (simple moving average comparison)
-        if len(df) >= 5:
-            recent_avg = df['close'].tail(5).mean()
-            earlier_avg = df['close'].head(5).mean()
+        if len(close) >= 5:
+            recent_avg = close[-5:].mean()
+            earlier_avg = close[:5].mean()
             trend_direction = "Bullish" if recent_avg > earlier_avg else "Bearish"
         else:
             trend_direction = "Neutral"
@@ -372,10 +804,10 @@ def analyze_price_movement(
                 "status": "Above Average" if volume_ratio > 1.2 else "Below Average" if volume_ratio < 0.8 else "Normal"
             },
             "summary": summary,
-            "data_points": len(df)
+            "data_points": table.num_rows
         }
         
-        logger.info(f"Successfully analyzed {symbol}: {trend_direction} trend, {volatility:.2f}% volatility")
+        logger.info("Successfully analyzed %s: %s trend, %.2f%% volatility", symbol, trend_direction, volatility)
         return result
         
     except Exception as e:
@@ -389,7 +821,8 @@ def analyze_price_movement(
 
 
 @mcp.tool
-def get_market_overview(
+@orjson_result
+async def get_market_overview(
     symbols: List[str] = None,
     category: str = "spot",
     interval: str = "D"
@@ -399,6 +832,7 @@ def get_market_overview(
     
     This tool provides a quick snapshot of multiple markets, perfect for monitoring
     portfolios, identifying opportunities, or getting a general market sentiment.
+    All symbols are fetched concurrently, within Bybit's rate limits.
     
     Args:
         symbols (List[str]): List of symbols to analyze. If None, uses popular defaults
@@ -422,24 +856,34 @@ def get_market_overview(
         • Quick market check: get_market_overview()
     """
     try:
+        import numpy as np
+        
         # Use default popular symbols if none provided
         if symbols is None:
             symbols = ['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'SOLUSDT', 'ADAUSDT', 'XRPUSDT', 'DOGEUSDT', 'AVAXUSDT']
         
-        logger.info(f"Getting market overview for {len(symbols)} symbols")
+        logger.info("Getting market overview for %d symbols", len(symbols))
+        
+        # Fetch all symbols at once over one session; a failed symbol maps to its exception.
+        # Arrow tables are enough since only the last closes and volume are read.
+        frames = await _get_ohlcv_many_async(
+            symbols, interval=interval, category=category, return_exceptions=True, as_="arrow"
+        )
         
         overview_data = []
         successful_fetches = 0
         
         for symbol in symbols:
             try:
-                # Get recent data for each symbol
-                df = get_ohlcv(symbol=symbol, interval=interval, category=category)
+                table = frames[symbol]
+                if isinstance(table, Exception):
+                    raise table
                 
-                if not df.empty and len(df) >= 2:
-                    current_price = float(df['close'].iloc[-1])
-                    previous_price = float(df['close'].iloc[-2])
-                    volume = float(df['volume'].iloc[-1])
+                if table.num_rows >= 2:
+                    close = table.column('close')
+                    current_price = close[-1].as_py()
+                    previous_price = close[-2].as_py()
+                    volume = table.column('volume')[-1].as_py()
                     
                     price_change = current_price - previous_price
                     price_change_pct = (price_change / previous_price * 100) if previous_price > 0 else 0
@@ -450,40 +894,56 @@ def get_market_overview(
                         "price_change": price_change,
                         "price_change_percentage": price_change_pct,
                         "volume": volume,
-                        "status": "✅"
+                        "status": _STATUS_OK
                     })
                     successful_fetches += 1
                 else:
                     overview_data.append({
                         "symbol": symbol,
                         "error": "Insufficient data",
-                        "status": "❌"
+                        "status": _STATUS_FAILED
                     })
                     
             except Exception as e:
                 overview_data.append({
                     "symbol": symbol,
                     "error": str(e),
-                    "status": "❌"
+                    "status": _STATUS_FAILED
                 })
         
         # Calculate market summary statistics
         valid_data = [item for item in overview_data if "price_change_percentage" in item]
         
         if valid_data:
-            price_changes = [item["price_change_percentage"] for item in valid_data]
-            avg_change = sum(price_changes) / len(price_changes)
+            changes = np.fromiter(
+                (item["price_change_percentage"] for item in valid_data),
+                dtype=np.float64, count=len(valid_data)
+            )
+            avg_change = changes.mean()
+            
+            # Count decliners, flat and gainers in one pass: sign -1, 0, 1 -> bucket 0, 1, 2
+            negative, neutral, positive = np.bincount(
+                np.sign(changes).astype(np.int64) + 1, minlength=3
+            ).tolist()
             
-            # Sort for top performers and decliners
-            sorted_by_performance = sorted(valid_data, key=lambda x: x["price_change_percentage"], reverse=True)
-            top_performers = sorted_by_performance[:3]
-            top_decliners = sorted_by_performance[-3:]
+            # Only the best and worst three are needed, so skip sorting everything.
+            # Both lists match the head and tail of a stable sort by change,
+            # descending: ties keep their input order, and decliners end with the worst
+            def performance(item):
+                return item["price_change_percentage"]
+            
+            def decline(pair):
+                index, item = pair
+                return performance(item), -index
+            
+            top_performers = heapq.nlargest(3, valid_data, key=performance)
+            top_decliners = [item for _, item in heapq.nsmallest(3, enumerate(valid_data), key=decline)][::-1]
             
             market_summary = {
                 "average_change": avg_change,
-                "positive_symbols": len([x for x in price_changes if x > 0]),
-                "negative_symbols": len([x for x in price_changes if x < 0]),
-                "neutral_symbols": len([x for x in price_changes if x == 0]),
+                "positive_symbols": positive,
+                "negative_symbols": negative,
+                "neutral_symbols": neutral,
                 "market_sentiment": "Bullish" if avg_change > 1 else "Bearish" if avg_change < -1 else "Neutral"
             }
         else:
@@ -508,7 +968,7 @@ def get_market_overview(
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"Market overview completed: {successful_fetches}/{len(symbols)} symbols processed")
+        logger.info("Market overview completed: %d/%d symbols processed", successful_fetches, len(symbols))
         return result
         
     except Exception as e:
@@ -521,7 +981,53 @@ def get_market_overview(
         }
 
 
-# Server metadata and information
+# Server metadata and information; constant, so built once instead of per call
+_SERVER_INFO: Dict[str, Any] = {
+    "server_name": "Bybit Trading Agent MCP Server",
+    "version": "1.0.0",
+    "description": "Advanced MCP server for cryptocurrency market data analysis via Bybit API",
+    "capabilities": [
+        "Historical OHLCV data fetching with pagination",
+        "Real-time market symbol discovery",
+        "Technical analysis and price movement insights",
+        "Multi-symbol market overview and monitoring",
+        "Support for spot, derivatives, and options markets"
+    ],
+    "available_tools": {
+        "fetch_historical_ohlcv": "Fetch historical candlestick data with advanced filtering",
+        "get_trading_symbols": "Discover available trading symbols by category",
+        "analyze_price_movement": "Perform technical analysis on price movements",
+        "get_market_overview": "Get comprehensive overview of multiple symbols",
+        "get_server_info": "Get information about server capabilities"
+    },
+    "supported_intervals": {
+        "minutes": ["1", "3", "5", "15", "30"],
+        "hours": ["60", "120", "240", "360", "720"],
+        "periods": ["D", "W", "M"]
+    },
+    "supported_categories": {
+        "spot": "Spot trading pairs (immediate settlement)",
+        "linear": "Linear derivatives (USDT margined)",
+        "inverse": "Inverse derivatives (coin margined)",
+        "option": "Options contracts"
+    },
+    "usage_examples": {
+        "basic_data": "fetch_historical_ohlcv('BTCUSDT', 'D')",
+        "date_range": "fetch_historical_ohlcv('ETHUSDT', '60', '2024-01-01', '2024-01-07')",
+        "symbols": "get_trading_symbols('spot')",
+        "analysis": "analyze_price_movement('BTCUSDT', 'D', 30)",
+        "overview": "get_market_overview(['BTCUSDT', 'ETHUSDT'])"
+    },
+    "tags": [
+        "cryptocurrency", "trading", "market-data", "bybit", "ohlcv",
+        "technical-analysis", "ai-trading", "mcp", "api", "real-time"
+    ]
+}
+
+# get_server_info's response, encoded once; every call returns this same ToolResult
+_SERVER_INFO_RESULT = _to_tool_result(_SERVER_INFO)
+
+
 @mcp.tool
 def get_server_info() -> Dict[str, Any]:
     """
@@ -535,47 +1041,9 @@ def get_server_info() -> Dict[str, Any]:
     
     Tags: #server-info #help #documentation #capabilities #tools
     """
-    return {
-        "server_name": "Bybit Trading Agent MCP Server",
-        "version": "1.0.0",
-        "description": "Advanced MCP server for cryptocurrency market data analysis via Bybit API",
-        "capabilities": [
-            "Historical OHLCV data fetching with pagination",
-            "Real-time market symbol discovery",
-            "Technical analysis and price movement insights",
-            "Multi-symbol market overview and monitoring",
-            "Support for spot, derivatives, and options markets"
-        ],
-        "available_tools": {
-            "fetch_historical_ohlcv": "Fetch historical candlestick data with advanced filtering",
-            "get_trading_symbols": "Discover available trading symbols by category",
-            "analyze_price_movement": "Perform technical analysis on price movements",
-            "get_market_overview": "Get comprehensive overview of multiple symbols",
-            "get_server_info": "Get information about server capabilities"
-        },
-        "supported_intervals": {
-            "minutes": ["1", "3", "5", "15", "30"],
-            "hours": ["60", "120", "240", "360", "720"],
-            "periods": ["D", "W", "M"]
-        },
-        "supported_categories": {
-            "spot": "Spot trading pairs (immediate settlement)",
-            "linear": "Linear derivatives (USDT margined)",
-            "inverse": "Inverse derivatives (coin margined)",
-            "option": "Options contracts"
-        },
-        "usage_examples": {
-            "basic_data": "fetch_historical_ohlcv('BTCUSDT', 'D')",
-            "date_range": "fetch_historical_ohlcv('ETHUSDT', '60', '2024-01-01', '2024-01-07')",
-            "symbols": "get_trading_symbols('spot')",
-            "analysis": "analyze_price_movement('BTCUSDT', 'D', 30)",
-            "overview": "get_market_overview(['BTCUSDT', 'ETHUSDT'])"
-        },
-        "tags": [
-            "cryptocurrency", "trading", "market-data", "bybit", "ohlcv",
-            "technical-analysis", "ai-trading", "mcp", "api", "real-time"
-        ]
-    }
+    # The response never changes, so it is served pre-encoded instead of
+    # going through orjson_result on every call
+    return _SERVER_INFO_RESULT
 
 
 if __name__ == "__main__":
@@ -583,11 +1051,12 @@ if __name__ == "__main__":
     port = int(os.getenv('PORT', 3001))  # Changed default port to 3001 for SSE
     host = os.getenv('HOST', '0.0.0.0')
     
-    # Add startup logging
-    logger.info("🚀 Starting Bybit Trading Agent MCP Server (SSE Transport)")
-    logger.info(f"🌐 Server accessible at: http://{host}:{port}")
-    logger.info(f"📡 SSE Endpoint: http://{host}:{port}/sse")
-    logger.info(f"🔗 n8n Docker Endpoint: http://host.docker.internal:{port}/sse")
+    # Legacy SSE entry point; start_mcp_server.py serves Streamable HTTP on /mcp
+    logger.info("🚀 Starting Bybit Trading Agent MCP Server (legacy SSE Transport)")
+    logger.info("ℹ️  For Streamable HTTP on /mcp, run start_mcp_server.py instead")
+    logger.info("🌐 Server accessible at: http://%s:%s", host, port)
+    logger.info("📡 SSE Endpoint: http://%s:%s/sse", host, port)
+    logger.info("🔗 n8n Docker Endpoint: http://host.docker.internal:%s/sse", port)
     logger.info("🔧 Available tools:")
     logger.info("   - fetch_historical_ohlcv: Get historical OHLCV data")
     logger.info("   - get_trading_symbols: List available symbols")
@@ -597,12 +1066,21 @@ if __name__ == "__main__":
     logger.info("✅ Server ready to accept SSE connections...")
     logger.info("💡 For n8n: Use 'http://host.docker.internal:3001/sse' as SSE Endpoint")
     
+    if uvloop is not None:
+        # mcp.run() creates its event loop through the asyncio policy
+        uvloop.install()
+    
     try:
         # Run the MCP server with SSE transport
         # FastMCP 2.0 supports SSE transport for n8n and other streaming clients
-        mcp.run(transport="sse", host=host, port=port)
+        mcp.run(
+            transport="sse",
+            host=host,
+            port=port,
+            uvicorn_config={"timeout_keep_alive": HTTP_KEEPALIVE_TIMEOUT}
+        )
     except KeyboardInterrupt:
         logger.info("🛑 Server shutdown requested by user")
     except Exception as e:
-        logger.error(f"❌ Server error: {e}")
+        logger.error("❌ Server error: %s", e)
         raise 
\ No newline at end of file
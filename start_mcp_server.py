@@ -1,86 +1,146 @@
 #!/usr/bin/env python3
 """
-Bybit Trading Agent MCP Server Startup Script (SSE Transport)
+Bybit Trading Agent MCP Server Startup Script (Streamable HTTP Transport)
 
-This script starts the MCP server with SSE (Server-Sent Events) transport for 
-n8n compatibility and web accessibility. It can be used to start the server 
+This script starts the MCP server with Streamable HTTP transport for n8n
+compatibility and web accessibility. It can be used to start the server 
 from different environments and provides clear feedback about the server status.
 
-The server will be accessible via SSE endpoints for streaming MCP communication.
-Compatible with n8n MCP Client Tool nodes and other SSE-based MCP clients.
+The server will be accessible at the /mcp endpoint. Older n8n MCP Client Tool
+nodes and other SSE-only clients can still be served from /sse with
+--transport sse.
 """
 
 import sys
 import os
-import subprocess
+import importlib.util
 import logging
 from pathlib import Path
+from types import SimpleNamespace
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Endpoint path each supported transport is served on
+TRANSPORT_PATHS = {"streamable-http": "/mcp", "sse": "/sse"}
+
+# Seconds uvicorn keeps idle client connections open; same as
+# mcp_server.HTTP_KEEPALIVE_TIMEOUT, which is not imported here so this
+# process never loads the server it is about to exec into
+HTTP_KEEPALIVE_TIMEOUT = 75
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import fastmcp
-        import pandas
-        import requests
-        from bybit.fetch_bybit import get_ohlcv, get_available_symbols
-        logger.info("✅ All dependencies are available")
-        return True
-    except ImportError as e:
-        logger.error(f"❌ Missing dependency: {e}")
+    # Only locate the modules; mcp_server imports them for real afterwards.
+    # The bybit package is probed rather than bybit.fetch_bybit, because
+    # finding a submodule imports its parent package.
+    missing = [name for name in ("fastmcp", "uvicorn", "pandas", "requests", "bybit", "mcp_server")
+               if importlib.util.find_spec(name) is None]
+    
+    if missing:
+        logger.error(f"❌ Missing dependency: {', '.join(missing)}")
         logger.error("Please install required packages:")
-        logger.error("pip install fastmcp pandas requests")
+        logger.error("pip install -r requirements.txt")
         return False
+    
+    logger.info("✅ All dependencies are available")
+    return True
 
-def start_server(port: int = None, host: str = "0.0.0.0"):
-    """Start the MCP server with SSE transport."""
+def create_app():
+    """Build the server's ASGI app; uvicorn calls this once in every worker process."""
+    from mcp_server import mcp
+    
+    # Consecutive requests of one client may reach different workers, so
+    # sessions cannot live in a single worker's memory
+    stateless = int(os.getenv('WORKERS', 1)) > 1
+    return mcp.http_app(transport=os.getenv('MCP_TRANSPORT', 'streamable-http'),
+                        stateless_http=stateless or None)
+
+def start_server(port: int = None, host: str = "0.0.0.0", transport: str = "streamable-http"):
+    """
+    Start the MCP server with Streamable HTTP (default) or SSE transport.
+    
+    On success the process is replaced by uvicorn and this never returns;
+    it returns False if the server could not be started.
+    """
     try:
         # Get port from parameter, environment variable, or use default
         if port is None:
             port = int(os.getenv('PORT', 3001))  # Changed default to 3001 for SSE
         
-        logger.info("🚀 Starting Bybit Trading Agent MCP Server (SSE Transport)...")
+        path = TRANSPORT_PATHS[transport]
+        
+        logger.info(f"🚀 Starting Bybit Trading Agent MCP Server ({transport} transport)...")
         logger.info(f"🌐 Server will be accessible at: http://{host}:{port}")
-        logger.info(f"📡 SSE Endpoint: http://{host}:{port}/sse")
-        logger.info(f"🔗 n8n Docker Endpoint: http://host.docker.internal:{port}/sse")
+        logger.info(f"📡 MCP Endpoint: http://{host}:{port}{path}")
+        logger.info(f"🔗 n8n Docker Endpoint: http://host.docker.internal:{port}{path}")
         
         # Check dependencies first
         if not check_dependencies():
             return False
         
-        # Set environment variables for SSE transport
+        # Set environment variables for the server and its worker processes
         os.environ['PORT'] = str(port)
         os.environ['HOST'] = host
+        os.environ['MCP_TRANSPORT'] = transport
+        workers = int(os.getenv('WORKERS', 1))
+        if transport == "sse" and workers > 1:
+            # An SSE stream and the messages posted for it must hit the same process
+            logger.warning("⚠️ SSE transport supports a single worker only, ignoring WORKERS")
+            workers = 1
+        os.environ['WORKERS'] = str(workers)
+        # Every worker runs its own Bybit rate limiter; split the per-IP budget
+        # between them instead of multiplying it by the number of workers
+        os.environ['BYBIT_RATE_LIMIT_PROCESSES'] = str(workers)
         
-        # Import and configure the server for SSE transport
-        from mcp_server import mcp
+        # Emit the banner as one log record, and only build it if INFO is shown
+        if logger.isEnabledFor(logging.INFO):
+            if transport == "sse":
+                client_hint = ("🔗 Example SSE test:\n"
+                               f"   curl -N -H \"Accept: text/event-stream\" http://{host}:{port}/sse")
+            else:
+                client_hint = "💡 Older SSE-only clients: restart with --transport sse for the /sse endpoint"
+            
+            banner = "\n".join([
+                "✅ Server configured successfully",
+                "🔧 Available tools:",
+                "   - fetch_historical_ohlcv: Get historical OHLCV data",
+                "   - get_trading_symbols: List available symbols",
+                "   - analyze_price_movement: Perform technical analysis",
+                "   - get_market_overview: Multi-symbol market overview",
+                "   - get_server_info: Server capabilities info",
+                f"⚙️ Uvicorn workers: {workers} (set WORKERS to change; they share one Bybit request budget)",
+                "✅ Server ready to accept MCP connections...",
+                f"📡 Access the MCP endpoint at: http://{host}:{port}{path}",
+                client_hint,
+                f"💡 For n8n MCP Client: Use 'http://host.docker.internal:{port}{path}'"
+            ])
+            logger.info("%s", banner)
         
-        logger.info("✅ Server initialized successfully")
-        logger.info("🔧 Available tools:")
-        logger.info("   - fetch_historical_ohlcv: Get historical OHLCV data")
-        logger.info("   - get_trading_symbols: List available symbols")
-        logger.info("   - analyze_price_movement: Perform technical analysis")
-        logger.info("   - get_market_overview: Multi-symbol market overview")
-        logger.info("   - get_server_info: Server capabilities info")
-        logger.info("✅ Server ready to accept SSE connections...")
-        logger.info(f"📡 Access the SSE endpoint at: http://{host}:{port}/sse")
-        logger.info("🔗 Example SSE test:")
-        logger.info(f"   curl -N -H \"Accept: text/event-stream\" http://{host}:{port}/sse")
-        logger.info("💡 For n8n MCP Client: Use 'http://host.docker.internal:3001/sse'")
+        # Streamable HTTP is the faster, non-deprecated transport for these
+        # request/response tools; SSE is kept for older clients.
+        # Uvicorn serves the app directly so it can run several worker
+        # processes, each building its own app through create_app(); it picks
+        # uvloop and httptools on its own when they are installed.
+        # The process is replaced by a fresh interpreter running uvicorn, so the
+        # server does not carry this script's start-up state and supervisors
+        # see the server process itself; the settings above reach it through
+        # the environment.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [
+            sys.executable, "-m", "uvicorn", "start_mcp_server:create_app", "--factory",
+            "--app-dir", str(Path(__file__).resolve().parent),
+            "--host", host,
+            "--port", str(port),
+            "--workers", str(workers),
+            "--timeout-keep-alive", str(HTTP_KEEPALIVE_TIMEOUT)
+        ])
         
-        # Run the server with SSE transport
-        # FastMCP 2.0 automatically provides SSE endpoints when transport="sse"
-        mcp.run(transport="sse", host=host, port=port)
-        
-    except KeyboardInterrupt:
-        logger.info("\n🛑 Server shutdown requested by user")
-        return True
     except Exception as e:
         logger.error(f"❌ Error starting server: {e}")
         logger.error("💡 Troubleshooting tips:")
@@ -92,34 +152,40 @@ def start_server(port: int = None, host: str = "0.0.0.0"):
         logger.error("   6. Try a different port: python start_mcp_server.py --port 3002")
         return False
 
-if __name__ == "__main__":
+def parse_args():
+    """Parse command line arguments; argparse is only loaded when there are any."""
+    if len(sys.argv) == 1:
+        return SimpleNamespace(port=None, host='0.0.0.0', transport='streamable-http')
+    
     import argparse
     
-    # Parse command line arguments
     parser = argparse.ArgumentParser(description='Start Bybit Trading Agent MCP Server')
     parser.add_argument('--port', '-p', type=int, default=None,
                        help='Port to run the server on (default: 3000 or PORT env var)')
     parser.add_argument('--host', default='0.0.0.0',
                        help='Host to bind the server to (default: 0.0.0.0)')
+    parser.add_argument('--transport', choices=list(TRANSPORT_PATHS), default='streamable-http',
+                       help='MCP transport to serve (default: streamable-http; sse for older clients)')
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    # Parse command line arguments
+    args = parse_args()
     
     print("=" * 70)
-    print("🚀 Bybit Trading Agent MCP Server (SSE Transport)")
+    print(f"🚀 Bybit Trading Agent MCP Server ({args.transport} transport)")
     print("=" * 70)
     print("Advanced MCP server for cryptocurrency market data analysis")
     print("Powered by Bybit V5 API with FastMCP 2.0")
-    print("📡 Transport: SSE (Server-Sent Events)")
+    print(f"📡 Transport: {args.transport}")
     print(f"🌐 Host: {args.host}")
     print(f"🔌 Port: {args.port or os.getenv('PORT', 3001)}")
-    print(f"📡 SSE Endpoint: http://{args.host}:{args.port or os.getenv('PORT', 3001)}/sse")
-    print("💡 For n8n: Use 'http://host.docker.internal:3001/sse'")
+    print(f"📡 MCP Endpoint: http://{args.host}:{args.port or os.getenv('PORT', 3001)}{TRANSPORT_PATHS[args.transport]}")
+    print(f"💡 For n8n: Use 'http://host.docker.internal:3001{TRANSPORT_PATHS[args.transport]}'")
     print("=" * 70)
     
-    success = start_server(port=args.port, host=args.host)
-    
-    if success:
-        print("\n✅ Server stopped gracefully")
-    else:
-        print("\n❌ Server encountered an error")
-        sys.exit(1) 
\ No newline at end of file
+    # Only returns if the server could not be started
+    start_server(port=args.port, host=args.host, transport=args.transport)
+    print("\n❌ Server encountered an error")
+    sys.exit(1) 
\ No newline at end of file
@@ -7,14 +7,178 @@ from fetch_bybit.py module.
 
 import sys
 import os
+import io
+import json
+import atexit
+import logging
+import contextlib
+import contextvars
+import functools
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import pandas as pd
 
 # Add the current directory to Python path to import fetch_bybit
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Give each run an empty bybit candle cache, so the tests never read or write
+# the developer's own cache and the pagination test always pages through the
+# (recorded) responses instead of reading the candles back from disk
+_CANDLE_CACHE_DIR = tempfile.mkdtemp(prefix='aitrader-test-')
+atexit.register(shutil.rmtree, _CANDLE_CACHE_DIR, ignore_errors=True)
+os.environ['AITRADER_CACHE_DIR'] = _CANDLE_CACHE_DIR
+
+from bybit import fetch_bybit
 from bybit.fetch_bybit import get_ohlcv, get_available_symbols
 
+# Configure logging (the bybit package leaves this to the application)
+logging.basicConfig(level=logging.INFO)
+
+# Symbol lists are kept on disk between test runs; an expired list is still
+# used while it is refreshed in the background (stale-while-revalidate)
+SYMBOLS_CACHE_DIR = Path.home() / '.cache'
+SYMBOLS_CACHE_TTL = 3600
+
+# Where each category's symbols came from in this run: 'disk', 'stale disk' or 'api'
+_symbols_source = {}
+
+# Set AITRADER_LIVE_TESTS=1 to page through the live last three days on every
+# run; by default the pagination test uses a fixed closed range whose kline
+# responses are recorded on the first run and replayed afterwards
+LIVE_TESTS = os.getenv('AITRADER_LIVE_TESTS') == '1'
+PAGINATION_RANGE = ('2024-01-01', '2024-01-04')
+PAGINATION_RECORDING = SYMBOLS_CACHE_DIR / 'bybit_pagination_klines.json'
+
+# Kline request parameters that mark a request as the pagination test's
+_PAGINATION_PARAMS = {'category': 'spot', 'symbol': 'BTCUSDT', 'interval': '1'}
+
+# Output buffer of the test running in the current thread, if any
+_test_output = contextvars.ContextVar('test_output', default=None)
+
+
+class _BufferedStdout(io.TextIOBase):
+    """sys.stdout stand-in that sends a running test's prints to its own buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = _test_output.get()
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+def _run_buffered(test_func):
+    """
+    Run one test with its output collected separately.
+    
+    Returns:
+        tuple: The test's printed output and the exception it raised, or None
+    """
+    buffer = io.StringIO()
+    token = _test_output.set(buffer)
+    try:
+        test_func()
+        error = None
+    except Exception as e:
+        error = e
+    finally:
+        _test_output.reset(token)
+    return buffer.getvalue(), error
+
+
+def _store_symbols(category, path):
+    """Fetch a category's symbols from Bybit and save them to path."""
+    symbols = get_available_symbols(category)
+    
+    if symbols:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(symbols))
+        os.replace(tmp_path, path)
+    
+    return symbols
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_symbols(category):
+    """Get a category's symbols, memoized in this run and cached on disk across runs."""
+    path = SYMBOLS_CACHE_DIR / f"bybit_symbols_{category}.json"
+    
+    try:
+        age = time.time() - path.stat().st_mtime
+        symbols = json.loads(path.read_text())
+    except (OSError, ValueError):
+        symbols = None
+    
+    if not symbols:
+        _symbols_source[category] = 'api'
+        return _store_symbols(category, path)
+    
+    if age >= SYMBOLS_CACHE_TTL:
+        _symbols_source[category] = 'stale disk'
+        threading.Thread(target=_store_symbols, args=(category, path), daemon=True).start()
+    else:
+        _symbols_source[category] = 'disk'
+    
+    return symbols
+
+
+@contextlib.contextmanager
+def _replayed_klines(path):
+    """
+    Serve the pagination test's kline requests from a recording at path.
+    
+    Without a recording the requests go to Bybit and, if the test finishes,
+    their responses are saved to path; later runs replay them without any
+    HTTP traffic. Requests of the other tests always go to Bybit.
+    """
+    try:
+        recording = json.loads(path.read_text())
+    except (OSError, ValueError):
+        recording = None
+    
+    recorded = {}
+    http_get = fetch_bybit._http_get
+    
+    async def replaying_http_get(session, url, params):
+        if not _PAGINATION_PARAMS.items() <= params.items():
+            return await http_get(session, url, params)
+        
+        key = json.dumps(params, sort_keys=True)
+        if recording is not None:
+            if key not in recording:
+                raise LookupError(f"No recorded response for {key}; delete {path} to record again")
+            return {}, recording[key].encode()
+        
+        headers, body = await http_get(session, url, params)
+        recorded[key] = body.decode()
+        return headers, body
+    
+    fetch_bybit._http_get = replaying_http_get
+    try:
+        yield
+    finally:
+        fetch_bybit._http_get = http_get
+    
+    if recording is None and recorded:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(recorded))
+        os.replace(tmp_path, path)
+
+
+def _date_window(days):
+    """Return the (start, end) dates of the last `days` days from a single datetime.now()."""
+    now = datetime.now()
+    return (now - timedelta(days=days)).strftime('%Y-%m-%d'), now.strftime('%Y-%m-%d')
+
 
 def test_basic_fetch():
     """Test basic OHLCV data fetching without date range."""
@@ -48,8 +212,7 @@ def test_date_range_fetch():
     
     try:
         # Get data for the last 7 days
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        start_date, end_date = _date_window(days=7)
         
         print(f"Fetching data from {start_date} to {end_date}")
         
@@ -77,21 +240,26 @@ def test_pagination():
     print("=" * 60)
     
     try:
-        # Get data for the last 30 days with 1-minute intervals
+        # Get 3 days of data with 1-minute intervals
         # This should trigger pagination as it's more than 1000 candles
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
+        start_date, end_date = _date_window(days=3) if LIVE_TESTS else PAGINATION_RANGE
         
         print(f"Fetching 1-minute data from {start_date} to {end_date}")
-        print("This should trigger pagination...")
+        if LIVE_TESTS:
+            print("This should trigger pagination...")
+        else:
+            action = "Replaying recorded" if PAGINATION_RECORDING.exists() else "Recording"
+            print(f"{action} responses in {PAGINATION_RECORDING} (AITRADER_LIVE_TESTS=1 for live data)")
         
-        df = get_ohlcv(
-            symbol='BTCUSDT',
-            interval='1',  # 1 minute
-            start_date=start_date,
-            end_date=end_date,
-            category='spot'
-        )
+        replay = contextlib.nullcontext() if LIVE_TESTS else _replayed_klines(PAGINATION_RECORDING)
+        with replay:
+            df = get_ohlcv(
+                symbol='BTCUSDT',
+                interval='1',  # 1 minute
+                start_date=start_date,
+                end_date=end_date,
+                category='spot'
+            )
         
         print(f"✅ Successfully fetched {len(df)} candles using pagination")
         print(f"Expected ~{3 * 24 * 60} candles (3 days * 24 hours * 60 minutes)")
@@ -99,6 +267,11 @@ def test_pagination():
         if len(df) > 1000:
             print("✅ Pagination worked correctly (more than 1000 candles)")
         
+        # Pages that overlap or leave gaps show up as steps other than one minute
+        steps = df['timestamp'].diff().dropna()
+        status = "✅" if (steps == 60 * 1000).all() else "❌"
+        print(f"{status} Candles are one minute apart with no gaps or duplicates")
+        
     except Exception as e:
         print(f"❌ Error in pagination test: {e}")
 
@@ -134,15 +307,22 @@ def test_available_symbols():
     
     try:
         # Test spot symbols
-        spot_symbols = get_available_symbols('spot')
+        spot_symbols = _cached_symbols('spot')
         print(f"✅ Found {len(spot_symbols)} spot symbols")
         print(f"First 10 spot symbols: {spot_symbols[:10]}")
         
         # Test linear derivatives symbols
-        linear_symbols = get_available_symbols('linear')
+        linear_symbols = _cached_symbols('linear')
         print(f"✅ Found {len(linear_symbols)} linear derivatives symbols")
         print(f"First 10 linear symbols: {linear_symbols[:10]}")
         
+        # Repeating a lookup must not go back to the API
+        _cached_symbols('spot')
+        info = _cached_symbols.cache_info()
+        status = "✅" if info.hits else "❌"
+        print(f"{status} Symbol cache: {info.hits} hits, {info.misses} misses")
+        print(f"Symbols loaded from: {_symbols_source}")
+        
     except Exception as e:
         print(f"❌ Error fetching available symbols: {e}")
 
@@ -189,14 +369,25 @@ def run_all_tests():
         test_error_handling
     ]
     
-    for test_func in test_functions:
-        try:
-            test_func()
-        except KeyboardInterrupt:
-            print("\n❌ Tests interrupted by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Unexpected error in {test_func.__name__}: {e}")
+    # The tests only wait on Bybit, so run them all at once; each test's
+    # output is printed in one piece as soon as it finishes
+    stdout = sys.stdout
+    sys.stdout = _BufferedStdout(stdout)
+    executor = ThreadPoolExecutor(max_workers=len(test_functions))
+    
+    try:
+        futures = {executor.submit(_run_buffered, test_func): test_func for test_func in test_functions}
+        
+        for future in as_completed(futures):
+            output, error = future.result()
+            print(output, end="")
+            if error is not None:
+                print(f"\n❌ Unexpected error in {futures[future].__name__}: {error}")
+    except KeyboardInterrupt:
+        print("\n❌ Tests interrupted by user")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        sys.stdout = stdout
     
     print("\n" + "=" * 60)
     print("🏁 Tests completed!")